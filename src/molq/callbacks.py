@@ -7,7 +7,6 @@ the monitoring loop.
 """
 
 import threading
-from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import StrEnum
@@ -32,7 +31,7 @@ class EventType(StrEnum):
     ALL_COMPLETED = "all_completed"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventPayload:
     """Lifecycle event payload."""
 
@@ -51,7 +50,9 @@ class EventBus:
     """
 
     def __init__(self) -> None:
-        self._handlers: dict[EventType, list[Callable]] = defaultdict(list)
+        # Copy-on-write: on()/off() swap in a new tuple under the lock, so
+        # emit() can read the current tuple without locking or copying.
+        self._handlers: dict[EventType, tuple[Callable, ...]] = {}
         self._lock = threading.Lock()
 
     def on(self, event: EventType, handler: Callable) -> None:
@@ -62,7 +63,7 @@ class EventBus:
             handler: Callable that receives the event data.
         """
         with self._lock:
-            self._handlers[event].append(handler)
+            self._handlers[event] = (*self._handlers.get(event, ()), handler)
 
     def off(self, event: EventType, handler: Callable) -> None:
         """Remove a previously registered callback.
@@ -72,8 +73,8 @@ class EventBus:
             handler: The handler to remove.
         """
         with self._lock:
-            handlers = self._handlers.get(event, [])
-            self._handlers[event] = [h for h in handlers if h is not handler]
+            handlers = self._handlers.get(event, ())
+            self._handlers[event] = tuple(h for h in handlers if h is not handler)
 
     def emit(self, event: EventType, data: Any = None) -> None:
         """Dispatch an event to all registered handlers.
@@ -82,12 +83,9 @@ class EventBus:
             event: Event type to emit.
             data: Event payload (StatusChange, JobRecord, or None).
         """
-        # Snapshot the handler list under the lock, then dispatch outside it
-        # so that handlers may freely on()/off() without deadlocking or
-        # mutating the list we are iterating.
-        with self._lock:
-            handlers = list(self._handlers.get(event, []))
-        for handler in handlers:
+        # The tuple is never mutated, so it is already a snapshot: handlers
+        # may freely on()/off() while we iterate it.
+        for handler in self._handlers.get(event, ()):
             try:
                 handler(data)
             except Exception:
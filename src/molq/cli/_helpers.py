@@ -178,8 +178,10 @@ def emit_log_text(stream_name: str, text: str, *, labeled: bool) -> None:
         sys.stdout.write(text)
         sys.stdout.flush()
         return
-    for chunk in text.splitlines(keepends=True):
-        sys.stdout.write(f"[{stream_name}] {chunk}")
+    prefix = f"[{stream_name}] "
+    sys.stdout.write(
+        "".join(prefix + chunk for chunk in text.splitlines(keepends=True))
+    )
     sys.stdout.flush()
 
 
@@ -389,8 +389,10 @@ def watch(
 
     with _helpers.open_submitor(scheduler, cluster, profile, config) as submitor:
         if all_jobs:
+            # Reconcile before deciding there is anything to watch; the stored
+            # snapshot may still list jobs that finished since the last poll.
             submitor.refresh_jobs()
-            active = [r for r in submitor.list_jobs(include_terminal=False)]
+            active = submitor.list_jobs(include_terminal=False)
             if not active:
                 rprint("[dim]No active jobs.[/]")
                 return
@@ -164,6 +164,16 @@ def daemon(
         float,
         typer.Option("--interval", help="Seconds between reconcile cycles"),
     ] = 5.0,
+    max_interval: Annotated[
+        float | None,
+        typer.Option(
+            "--max-interval",
+            help=(
+                "Back off up to this many seconds while no job changes state "
+                "(default: no backoff, poll every --interval)"
+            ),
+        ),
+    ] = None,
     skip_cleanup: Annotated[
         bool,
         typer.Option(
@@ -191,7 +201,10 @@ def daemon(
     ) as submitor:
         try:
             submitor.run_daemon(
-                once=once, interval=interval, run_cleanup=not skip_cleanup
+                once=once,
+                interval=interval,
+                max_interval=max_interval,
+                run_cleanup=not skip_cleanup,
             )
         except KeyboardInterrupt:
             rprint("[dim]Daemon interrupted[/]")
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from molq.submitor import Submitor
 
 
-@dataclass
+@dataclass(slots=True)
 class JobHandle:
     """Lightweight handle for a submitted job.
 
@@ -36,16 +36,14 @@ def job_dir_path(
     return job_dir_root(jobs_dir, cwd) / (dir_name or job_id)
 
 
-def prepare_job_dir(
-    transport: Transport,
-    jobs_dir: Path | None,
-    job_id: str,
-    cwd: str,
-    dir_name: str | None = None,
-) -> Path:
-    """Create the job directory on the transport's filesystem and lock it down."""
-    transport.mkdir(str(job_dir_root(jobs_dir, cwd)), parents=True, exist_ok=True)
-    job_dir = job_dir_path(jobs_dir, job_id, cwd, dir_name)
+def prepare_job_dir(transport: Transport, job_dir: Path) -> None:
+    """Create *job_dir* on the transport's filesystem and lock it down.
+
+    Takes the path :func:`job_dir_path` already produced for the submission
+    rather than rebuilding it from the same inputs.
+    """
+    # parents=True brings the jobs root along; a separate mkdir for it would
+    # cost an extra ssh round trip per submission on remote clusters.
     transport.mkdir(str(job_dir), parents=True, exist_ok=True)
     # mode=0o700 is honoured by LocalTransport-backed pathlib only on
     # creation; for SshTransport mkdir uses the remote umask.  Set it
@@ -55,7 +53,6 @@ def prepare_job_dir(
     except Exception:
         # chmod failures are non-fatal — the directory exists and is usable.
         pass
-    return job_dir
 
 
 def resolve_cwd(cwd: str | Path | None) -> str:
@@ -99,7 +96,7 @@ def materialize_script(transport: Transport, script: Script, job_dir: Path) -> N
 
 def write_manifest(
     transport: Transport,
-    jobs_dir: Path | None,
+    job_dir: Path,
     spec: JobSpec,
     now: float,
 ) -> None:
@@ -109,7 +106,6 @@ def write_manifest(
     can tell which molq job it belongs to and where its streams went, without
     the database.
     """
-    job_dir = job_dir_path(jobs_dir, spec.job_id, spec.cwd, spec.dir_name)
     has_script_file = (
         spec.command.script is not None and spec.command.script.variant == "path"
     )
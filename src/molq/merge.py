@@ -6,12 +6,26 @@ Pure function that merges per-submit parameters with Submitor defaults.
 from __future__ import annotations
 
 import dataclasses
+import functools
 from typing import Any, cast
 
 from molq.models import SubmitorDefaults
 from molq.types import JobExecution, JobResources, JobScheduling
 
 
+@functools.cache
+def _field_defaults(cls: type) -> tuple[tuple[str, object], ...]:
+    """Return ``(name, default)`` for each field of *cls*, computed once per class.
+
+    Fields without a plain default (required or ``default_factory``) map to None.
+    """
+    # ``cls`` is always a frozen dataclass at call sites; cast for ty/dataclasses.
+    return tuple(
+        (f.name, f.default if f.default is not dataclasses.MISSING else None)
+        for f in dataclasses.fields(cast(Any, cls))
+    )
+
+
 def _merge_one[T](default: T | None, override: T | None, cls: type[T]) -> T:
     """Merge a single defaults/override pair using field-level shallow override.
 
@@ -27,16 +41,13 @@ def _merge_one[T](default: T | None, override: T | None, cls: type[T]) -> T:
         return default
 
     merged_fields: dict[str, object] = {}
-    # ``cls`` is always a frozen dataclass at call sites; cast for ty/dataclasses.
-    for f in dataclasses.fields(cast(Any, cls)):
-        override_val = getattr(override, f.name)
-        default_val = getattr(default, f.name)
+    for name, field_default in _field_defaults(cls):
+        override_val = getattr(override, name)
         # Use override value if it's not the field's default
-        field_default = f.default if f.default is not dataclasses.MISSING else None
         if override_val != field_default:
-            merged_fields[f.name] = override_val
+            merged_fields[name] = override_val
         else:
-            merged_fields[f.name] = default_val
+            merged_fields[name] = getattr(default, name)
 
     return cls(**merged_fields)  # type: ignore[call-arg]
 
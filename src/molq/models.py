@@ -21,7 +21,7 @@ from molq.types import JobExecution, JobResources, JobScheduling, Script
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Command:
     """Three-way exclusive command representation."""
 
@@ -85,7 +85,7 @@ class Command:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetryBackoff:
     """Retry delay policy."""
 
@@ -95,7 +95,7 @@ class RetryBackoff:
     factor: float = 2.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetryPolicy:
     """Retry policy applied by molq after terminal failures."""
 
@@ -105,7 +105,7 @@ class RetryPolicy:
     backoff: RetryBackoff = field(default_factory=RetryBackoff)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetentionPolicy:
     """Retention policy for job artifacts and terminal records."""
 
@@ -114,7 +114,7 @@ class RetentionPolicy:
     keep_failed_job_dirs: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RememberedAllocation:
     """A scheduling config previously used to submit to a cluster.
 
@@ -133,7 +133,7 @@ class RememberedAllocation:
     use_count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobDependency:
     """Persisted dependency edge between two molq jobs."""
 
@@ -143,7 +143,7 @@ class JobDependency:
     scheduler_dependency: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DependencyPreviewItem:
     """Dependency relation enriched with related job state."""
 
@@ -155,7 +155,7 @@ class DependencyPreviewItem:
     scheduler_dependency: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DependencyPreview:
     """Depth-1 dependency preview for a single job."""
 
@@ -167,7 +167,7 @@ class DependencyPreview:
     downstream: tuple[DependencyPreviewItem, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobSpec:
     """Internal canonical job specification. Not exported."""
 
@@ -198,7 +198,7 @@ class JobSpec:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobRecord:
     """Immutable snapshot of a job's full lifecycle state."""
 
@@ -224,7 +224,7 @@ class JobRecord:
     cleaned_at: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatusTransition:
     """Immutable persisted lifecycle transition for a job."""
 
@@ -240,7 +240,7 @@ class StatusTransition:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SubmitorDefaults:
     """Default resource, scheduling, and execution parameters for a Submitor."""
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 import threading
 
 from molq._log import get_logger
+from molq.callbacks import EventBus, EventPayload, EventType
 from molq.errors import MolqTimeoutError
 from molq.models import JobRecord
 from molq.reconciler import JobReconciler
@@ -22,6 +23,11 @@ logger = get_logger(__name__)
 class JobMonitor:
     """Polling engine with pluggable strategies.
 
+    Given an *event_bus*, waiters also wake as soon as a job they watch
+    reaches a terminal state — a cancel or another thread's refresh does not
+    have to wait out the current backoff interval to be noticed, and an
+    unrelated job finishing does not trigger an extra poll.
+
     Not intended for direct user construction.
     """
 
@@ -30,11 +36,27 @@ class JobMonitor:
         reconciler: JobReconciler,
         store: JobStore,
         strategy: PollingStrategy | None = None,
+        *,
+        event_bus: EventBus | None = None,
     ) -> None:
         self._reconciler = reconciler
         self._store = store
         self._strategy = strategy or ExponentialBackoffStrategy()
         self._stop = threading.Event()
+        # Counts of terminal transitions: ``_generation`` over every job (for
+        # cluster-wide waits), ``_family_generations`` per retry family that
+        # some waiter registered in ``_watchers``.  A waiter sleeps only while
+        # its count is unchanged, so a notification between its check and its
+        # wait is not lost.
+        self._wake = threading.Condition()
+        self._generation = 0
+        self._family_generations: dict[str, int] = {}
+        self._watchers: dict[str, int] = {}
+        self._event_bus = event_bus
+        # EventBus.off() matches by identity, so keep the one bound method.
+        self._status_handler = self._on_status_change
+        if event_bus is not None:
+            event_bus.on(EventType.STATUS_CHANGE, self._status_handler)
 
     def wait_one(
         self,
@@ -50,13 +72,29 @@ class JobMonitor:
         import time
 
         start = time.time()
+        # Backoff restarts whenever the job changes state: a job that sat
+        # queued for hours should not then be polled at the maximum interval
+        # for its whole run.
+        backoff_start = start
         poll_count = 0
+        last_state: JobState | None = None
+        families = self._families_of([job_id])
+        self._watch(families)
 
         try:
             while True:
+                # Snapshot before reconciling: a transition recorded by
+                # another thread after reconcile_one() read the scheduler
+                # must still cut the following sleep short.
+                generation = self._generation_of(families)
                 latest = self._store.get_latest_attempt_record(job_id)
                 watched_job_id = latest.job_id if latest is not None else job_id
                 state = self._reconciler.reconcile_one(watched_job_id)
+                if state != last_state:
+                    if last_state is not None:
+                        backoff_start = time.time()
+                        poll_count = 0
+                    last_state = state
 
                 if state is not None and JobState(state).is_terminal:
                     record = self._store.get_latest_attempt_record(job_id)
@@ -74,16 +112,18 @@ class JobMonitor:
                         job_id=job_id,
                     )
 
-                interval = self._strategy.next_interval(time.time() - start, poll_count)
-                # wait() returns True iff the event was set during the wait,
-                # so we observe stop() promptly without a check-then-wait race.
-                if self._stop.wait(interval):
+                interval = self._strategy.next_interval(
+                    time.time() - backoff_start, poll_count
+                )
+                if self._sleep(interval, generation, families):
                     break
                 poll_count += 1
 
         except KeyboardInterrupt:
             logger.info("Monitoring interrupted by user")
             raise
+        finally:
+            self._unwatch(families)
 
         # Stopped externally
         record = self._store.get_record(job_id)
@@ -121,9 +161,18 @@ class JobMonitor:
             else [r.job_id for r in self._store.get_active_records(cluster_name)]
         )
 
+        backoff_start = start
+        families = self._families_of(job_ids) if job_ids is not None else None
+        if families is not None:
+            self._watch(families)
+
         try:
             while True:
-                self._reconciler.reconcile()
+                if self._reconciler.reconcile():
+                    # Something moved; poll briskly again (see wait_one).
+                    backoff_start = time.time()
+                    poll_count = 0
+                generation = self._generation_of(families)
 
                 if job_ids is not None:
                     records = [
@@ -145,22 +194,127 @@ class JobMonitor:
                         f"Jobs did not complete within {timeout}s",
                     )
 
-                interval = self._strategy.next_interval(time.time() - start, poll_count)
-                if self._stop.wait(interval):
+                interval = self._strategy.next_interval(
+                    time.time() - backoff_start, poll_count
+                )
+                if self._sleep(interval, generation, families):
                     break
                 poll_count += 1
 
         except KeyboardInterrupt:
             logger.info("Monitoring interrupted by user")
             raise
+        finally:
+            if families is not None:
+                self._unwatch(families)
 
         return self._records_for(watched)
 
+    def wait_for_capacity(self, cluster_name: str, limit: int) -> int:
+        """Block until fewer than *limit* of the cluster's jobs are active.
+
+        Returns the number of free slots, or 0 if the monitor was stopped.
+        The store is consulted first, so no scheduler query is made while
+        there is room.
+        """
+        import time
+
+        start = time.time()
+        poll_count = 0
+
+        while True:
+            free = limit - len(self._store.get_active_records(cluster_name))
+            if free > 0:
+                return free
+            self._reconciler.reconcile()
+            generation = self._generation_of(None)
+            free = limit - len(self._store.get_active_records(cluster_name))
+            if free > 0:
+                return free
+
+            interval = self._strategy.next_interval(time.time() - start, poll_count)
+            if self._sleep(interval, generation):
+                return 0
+            poll_count += 1
+
     def _records_for(self, job_ids: list[str]) -> list[JobRecord]:
         """Latest-attempt records for *job_ids*, skipping any that vanished."""
         records = (self._store.get_latest_attempt_record(jid) for jid in job_ids)
         return [record for record in records if record is not None]
 
+    def _families_of(self, job_ids: list[str]) -> list[str]:
+        """Retry-family roots of *job_ids*, so a retry's attempts count too."""
+        families = []
+        for jid in job_ids:
+            record = self._store.get_latest_attempt_record(jid)
+            if record is not None:
+                jid = record.root_job_id or record.job_id
+            families.append(jid)
+        return families
+
+    def _watch(self, families: list[str]) -> None:
+        with self._wake:
+            for family in families:
+                self._watchers[family] = self._watchers.get(family, 0) + 1
+                self._family_generations.setdefault(family, 0)
+
+    def _unwatch(self, families: list[str]) -> None:
+        with self._wake:
+            for family in families:
+                remaining = self._watchers[family] - 1
+                if remaining:
+                    self._watchers[family] = remaining
+                else:
+                    del self._watchers[family]
+                    del self._family_generations[family]
+
+    def _generation_of(self, families: list[str] | None) -> int:
+        """Terminal transitions so far in *families* (``None``: any job)."""
+        with self._wake:
+            if families is None:
+                return self._generation
+            return sum(self._family_generations[family] for family in families)
+
+    def _sleep(
+        self, interval: float, generation: int, families: list[str] | None = None
+    ) -> bool:
+        """Wait up to *interval*; return True iff the monitor was stopped.
+
+        Returns early when a job in *families* (any job, if ``None``) went
+        terminal after *generation* was read.
+        """
+        with self._wake:
+            self._wake.wait_for(
+                lambda: self._stop.is_set()
+                or self._generation_of(families) != generation,
+                interval,
+            )
+        return self._stop.is_set()
+
+    def _on_status_change(self, payload: EventPayload) -> None:
+        transition = payload.transition
+        if transition is None or not JobState(transition.new_state).is_terminal:
+            return
+        record = payload.record
+        if record is not None:
+            family = record.root_job_id or record.job_id
+        else:
+            family = payload.job_id
+        with self._wake:
+            self._generation += 1
+            if family in self._family_generations:
+                self._family_generations[family] += 1
+            self._wake.notify_all()
+
     def stop(self) -> None:
         """Signal the monitor to stop."""
-        self._stop.set()
+        with self._wake:
+            self._stop.set()
+            self._wake.notify_all()
+
+    def close(self) -> None:
+        """Stop and unsubscribe from the event bus."""
+        self.stop()
+        if self._event_bus is not None:
+            self._event_bus.off(EventType.STATUS_CHANGE, self._status_handler)
+            self._event_bus = None
@@ -15,13 +15,19 @@ class LocalSchedulerOptions:
 
 @dataclass(frozen=True)
 class SlurmSchedulerOptions:
-    """Options for SLURM scheduler."""
+    """Options for SLURM scheduler.
+
+    ``only_job_state`` adds ``--only-job-state`` to status polls, which
+    slurmctld answers from its job-state cache instead of building full job
+    records.  Requires Slurm 24.05+, so it is opt-in.
+    """
 
     sbatch_path: str = "sbatch"
     squeue_path: str = "squeue"
     scancel_path: str = "scancel"
     sacct_path: str = "sacct"
     extra_sbatch_flags: tuple[str, ...] = ()
+    only_job_state: bool = False
 
 
 @dataclass(frozen=True)
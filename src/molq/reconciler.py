@@ -5,18 +5,25 @@ Syncs scheduler state with the JobStore. Internal module.
 
 from __future__ import annotations
 
+import math
 import time
 
 # Use a broad type hint since we accept any Scheduler-like object
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import replace
+from pathlib import Path
 from typing import Any, Protocol
 
+from molq._log import get_logger
 from molq.callbacks import EventBus, EventPayload, EventType
+from molq.errors import SchedulerError
 from molq.models import JobRecord, StatusTransition
 from molq.scheduler import TerminalStatus
 from molq.status import JobState
 from molq.store import JobStore
+from molq.transport import TransportError
+
+logger = get_logger(__name__)
 
 
 class _SchedulerLike(Protocol):
@@ -49,6 +56,10 @@ class JobReconciler:
 
     Each call to reconcile() performs one poll cycle: load active jobs,
     batch-query the scheduler, compute diffs, update the store.
+
+    With a positive *poll_ttl*, jobs the scheduler answered for within the
+    last *poll_ttl* seconds are left out of the query, so callers that
+    refresh in quick succession share one ``squeue``/``qstat``/``bjobs``.
     """
 
     def __init__(
@@ -60,6 +71,7 @@ class JobReconciler:
         jobs_dir: Any | None = None,
         event_bus: EventBus | None = None,
         on_terminal: Callable[[JobRecord], None] | None = None,
+        poll_ttl: float = 0.0,
     ) -> None:
         self._scheduler = scheduler
         self._store = store
@@ -67,6 +79,24 @@ class JobReconciler:
         self._jobs_dir = jobs_dir
         self._event_bus = event_bus
         self._on_terminal = on_terminal
+        # A job the scheduler was asked about less than *poll_ttl* seconds ago
+        # is not asked about again: its stored state is that answer.  Keyed by
+        # scheduler job id, stamped with time.monotonic().
+        self._poll_ttl = poll_ttl
+        self._polled_at: dict[str, float] = {}
+        # ShellScheduler resolves terminal status from job_dir/.exit_code; the
+        # batch backends don't need job_dir.  Duck-type the optional method
+        # once here rather than per disappeared job.
+        resolve_with_dir = getattr(type(scheduler), "resolve_terminal_with_dir", None)
+        self._resolve_with_dir: Callable[..., Any] | None = (
+            resolve_with_dir if callable(resolve_with_dir) else None
+        )
+        # Backends that can resolve several finished jobs in one call
+        # (SlurmScheduler's single sacct) get them batched per cycle.
+        resolve_many = getattr(type(scheduler), "resolve_terminal_many", None)
+        self._resolve_many: Callable[..., Any] | None = (
+            resolve_many if callable(resolve_many) else None
+        )
 
     def reconcile(self) -> list[StatusChange]:
         """Run one reconciliation cycle for all active jobs."""
@@ -80,17 +110,28 @@ class JobReconciler:
             if record.scheduler_job_id:
                 id_map[record.scheduler_job_id] = record.job_id
 
-        if not id_map:
+        stale = self._stale(id_map)
+        if not stale:
             return []
 
         # Batch query scheduler
-        scheduler_states = self._scheduler.poll_many(list(id_map.keys()))
+        scheduler_states = self._poll(stale)
+        if scheduler_states is None:
+            return []
+        stale_ids = set(stale)
+        prefetched = self._prefetch_terminal(
+            [
+                sid
+                for sid in stale
+                if sid not in scheduler_states or scheduler_states[sid].is_terminal
+            ]
+        )
         now = time.time()
         changes: list[StatusChange] = []
         polled: list[str] = []
 
         for record in active:
-            if not record.scheduler_job_id:
+            if record.scheduler_job_id not in stale_ids:
                 continue
 
             sid = record.scheduler_job_id
@@ -99,12 +140,14 @@ class JobReconciler:
             if sid in scheduler_states:
                 new_state = scheduler_states[sid]
                 terminal = (
-                    self._infer_terminal(sid, record, fallback_state=new_state)
+                    self._infer_terminal(
+                        sid, record, fallback_state=new_state, prefetched=prefetched
+                    )
                     if new_state.is_terminal
                     else None
                 )
             else:
-                terminal = self._infer_terminal(sid, record)
+                terminal = self._infer_terminal(sid, record, prefetched=prefetched)
                 new_state = terminal.state
 
             polled.append(record.job_id)
@@ -148,12 +191,14 @@ class JobReconciler:
         if record is None or record.state.is_terminal:
             return record.state if record else None
 
-        if not record.scheduler_job_id:
+        sid = record.scheduler_job_id
+        if not sid or not self._stale([sid]):
             return record.state
 
         now = time.time()
-        result = self._scheduler.poll_many([record.scheduler_job_id])
-        sid = record.scheduler_job_id
+        result = self._poll([sid])
+        if result is None:
+            return record.state
 
         if sid in result:
             new_state = result[sid]
@@ -192,26 +237,74 @@ class JobReconciler:
         self._store.update_job(job_id, last_polled=now)
         return new_state
 
+    def _stale(self, scheduler_job_ids: Iterable[str]) -> list[str]:
+        """The ids whose last scheduler answer is older than the poll TTL."""
+        if self._poll_ttl <= 0:
+            return list(scheduler_job_ids)
+        cutoff = time.monotonic() - self._poll_ttl
+        polled_at = self._polled_at
+        return [
+            sid for sid in scheduler_job_ids if polled_at.get(sid, -math.inf) < cutoff
+        ]
+
+    def _poll(self, scheduler_job_ids: list[str]) -> dict[str, JobState] | None:
+        """One ``poll_many`` call, remembered for the poll TTL.
+
+        Returns ``None`` when the scheduler could not be reached.  The stored
+        states then stand until a later cycle gets an answer; treating the
+        failure as an empty queue would resolve every job as finished, or
+        mark it LOST when accounting is unreachable too.
+        """
+        try:
+            result = self._scheduler.poll_many(scheduler_job_ids)
+        except (TransportError, SchedulerError) as exc:
+            logger.warning(f"scheduler poll failed, keeping last known states: {exc}")
+            return None
+        if self._poll_ttl > 0:
+            stamp = time.monotonic()
+            cutoff = stamp - self._poll_ttl
+            # Drop expired stamps so ids of long-finished jobs do not pile up.
+            self._polled_at = {
+                sid: at for sid, at in self._polled_at.items() if at >= cutoff
+            }
+            self._polled_at.update(dict.fromkeys(scheduler_job_ids, stamp))
+        return result
+
+    def _prefetch_terminal(
+        self, scheduler_job_ids: list[str]
+    ) -> dict[str, TerminalStatus] | None:
+        """Batch-resolve this cycle's finished jobs, if the backend supports it.
+
+        ``None`` means "not prefetched" and sends :meth:`_infer_terminal` to the
+        per-job ``resolve_terminal``; a single job gains nothing from batching.
+        """
+        if self._resolve_many is None or len(scheduler_job_ids) < 2:
+            return None
+        resolved = self._resolve_many(self._scheduler, scheduler_job_ids)
+        out: dict[str, TerminalStatus] = {}
+        for sid, status in resolved.items():
+            normalized = _normalize_terminal_status(status)
+            if normalized is not None:
+                out[sid] = normalized
+        return out
+
     def _infer_terminal(
         self,
         scheduler_job_id: str,
         record: JobRecord,
         fallback_state: JobState | None = None,
+        *,
+        prefetched: dict[str, TerminalStatus] | None = None,
     ) -> TerminalStatus:
         """Determine terminal state for a disappeared job.
 
         Takes the caller's *record* rather than re-reading it: this runs once
-        per disappeared job per cycle.
+        per disappeared job per cycle.  *prefetched* holds the cycle's batched
+        answers; an id missing from it had no accounting record.
         """
         job_id = record.job_id
-        # ShellScheduler resolves terminal status from job_dir/.exit_code; the
-        # batch backends don't need job_dir.  Duck-type the optional method.
-        resolve_with_dir = getattr(
-            type(self._scheduler), "resolve_terminal_with_dir", None
-        )
-        if callable(resolve_with_dir):
-            from pathlib import Path
-
+        resolve_with_dir = self._resolve_with_dir
+        if resolve_with_dir is not None:
             job_dir_value = record.metadata.get("molq.job_dir")
             if job_dir_value:
                 result = _normalize_terminal_status(
@@ -229,9 +322,12 @@ class JobReconciler:
                 if result is not None:
                     return result
 
-        result = _normalize_terminal_status(
-            self._scheduler.resolve_terminal(scheduler_job_id)
-        )
+        if prefetched is not None:
+            result = prefetched.get(scheduler_job_id)
+        else:
+            result = _normalize_terminal_status(
+                self._scheduler.resolve_terminal(scheduler_job_id)
+            )
         if result is not None:
             return result
 
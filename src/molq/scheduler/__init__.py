@@ -39,6 +39,14 @@ from molq.transport import Transport
 # Factory
 # ---------------------------------------------------------------------------
 
+# Backend name -> (implementation, the options type it accepts).
+_BACKENDS: dict[str, tuple[type, type[SchedulerOptions]]] = {
+    "local": (ShellScheduler, LocalSchedulerOptions),
+    "slurm": (SlurmScheduler, SlurmSchedulerOptions),
+    "pbs": (PBSScheduler, PBSSchedulerOptions),
+    "lsf": (LSFScheduler, LSFSchedulerOptions),
+}
+
 
 def create_scheduler(
     scheduler_name: str,
@@ -55,27 +63,14 @@ def create_scheduler(
     workstation (:class:`~molq.transport.SshTransport`).  ``"slurm"``,
     ``"pbs"`` and ``"lsf"`` route batch commands through the same transport.
     """
-    if scheduler_name == "local":
-        return ShellScheduler(
-            options if isinstance(options, LocalSchedulerOptions) else None,
-            transport=transport,
-        )
-    if scheduler_name == "slurm":
-        return SlurmScheduler(
-            options if isinstance(options, SlurmSchedulerOptions) else None,
-            transport=transport,
-        )
-    if scheduler_name == "pbs":
-        return PBSScheduler(
-            options if isinstance(options, PBSSchedulerOptions) else None,
-            transport=transport,
-        )
-    if scheduler_name == "lsf":
-        return LSFScheduler(
-            options if isinstance(options, LSFSchedulerOptions) else None,
-            transport=transport,
-        )
-    raise ValueError(f"Unknown scheduler: {scheduler_name!r}")
+    try:
+        scheduler_cls, options_cls = _BACKENDS[scheduler_name]
+    except KeyError:
+        raise ValueError(f"Unknown scheduler: {scheduler_name!r}") from None
+    return scheduler_cls(
+        options if isinstance(options, options_cls) else None,
+        transport=transport,
+    )
 
 
 __all__ = [
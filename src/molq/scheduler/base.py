@@ -29,7 +29,13 @@ class Scheduler(Protocol):
         ...
 
     def poll_many(self, scheduler_job_ids: Sequence[str]) -> dict[str, JobState]:
-        """Batch query. Returns scheduler_job_id -> JobState."""
+        """Batch query. Returns scheduler_job_id -> JobState.
+
+        Ids absent from the result have left the queue.  Raises
+        :class:`~molq.transport.TransportError` when the command could not be
+        run, or :class:`~molq.errors.SchedulerError` when it ran but the
+        scheduler did not answer (controller down, permission denied).
+        """
         ...
 
     def cancel(self, scheduler_job_id: str) -> None:
@@ -57,7 +63,7 @@ class Scheduler(Protocol):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DependencyEdge:
     """One "wait for that job, under this condition" edge.
 
@@ -85,7 +91,7 @@ def _dependency_keyword(
     return keyword
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QueueEntry:
     """A row from the scheduler's current queue.
 
@@ -103,7 +109,7 @@ class QueueEntry:
     start_time: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TerminalStatus:
     """Terminal scheduler resolution with optional failure metadata."""
 
@@ -113,7 +119,7 @@ class TerminalStatus:
     raw_state: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SchedulerCapabilities:
     """Declared scheduler support matrix used for submit-time validation."""
 
@@ -34,6 +34,8 @@ _LSF_DONE_RE = re.compile(r"done successfully|completed\s*<done>")
 _LSF_EXIT_CODE_RE = re.compile(r"exited with exit code\s+(\d+)")
 _LSF_EXITED_RE = re.compile(r"\bexited\b|completed\s*<exit>")
 _LSF_KILLED_RE = re.compile(r"term_owner|term_force_owner|signal\s*<kill>")
+# Start of one job's section in multi-job `bhist -l` output.
+_BHIST_JOB_RE = re.compile(r"^Job <(\d+)", re.MULTILINE)
 
 _LSF_STATE_MAP: dict[str, JobState] = {
     "RUN": JobState.RUNNING,
@@ -114,11 +116,12 @@ class LSFScheduler:
 
         cmd = [self._opts.bjobs_path, "-noheader"] + list(scheduler_job_ids)
 
-        try:
-            result = self._transport.run(cmd, timeout=30)
-        except TransportError as e:
-            logger.warning(f"bjobs invocation failed: {e}")
-            return {}
+        # A TransportError propagates: "could not ask" must not read as
+        # "every job has left the queue".  bjobs exits non-zero when any id is
+        # unknown ("Job <N> is not found"); anything else is a real failure.
+        result = self._transport.run(cmd, timeout=30)
+        if result.returncode != 0 and not _only_gone_ids(result.stderr):
+            raise SchedulerError("bjobs failed", stderr=result.stderr, command=cmd)
         if not result.stdout.strip():
             return {}
 
@@ -137,9 +140,12 @@ class LSFScheduler:
         return out
 
     def cancel(self, scheduler_job_id: str) -> None:
+        self.cancel_many([scheduler_job_id])
+
+    def cancel_many(self, scheduler_job_ids: Sequence[str]) -> None:
         try:
             self._transport.run(
-                [self._opts.bkill_path, scheduler_job_id],
+                [self._opts.bkill_path, *scheduler_job_ids],
                 timeout=30,
             )
         except TransportError:
@@ -155,35 +161,39 @@ class LSFScheduler:
             return None
         if result.returncode != 0 or not result.stdout.strip():
             return None
+        return _bhist_terminal(result.stdout.lower())
 
-        lower = result.stdout.lower()
-
-        # `bhist -l` is prose, and it echoes the job's own command line back.
-        # Match the phrases LSF actually emits rather than bare substrings —
-        # a job named "rundone" or a path containing "exit" used to decide the
-        # outcome.
-        if _LSF_KILLED_RE.search(lower):
-            return TerminalStatus(
-                state=JobState.CANCELLED,
-                failure_reason=_default_failure_reason(
-                    JobState.CANCELLED, None, "killed"
-                ),
-                raw_state="killed",
-            )
-        if _LSF_DONE_RE.search(lower):
-            return TerminalStatus(
-                state=JobState.SUCCEEDED, exit_code=0, raw_state="done"
-            )
-        match = _LSF_EXIT_CODE_RE.search(lower)
-        if match is not None or _LSF_EXITED_RE.search(lower):
-            code = int(match.group(1)) if match is not None else None
-            return TerminalStatus(
-                state=JobState.FAILED,
-                exit_code=code,
-                failure_reason=_default_failure_reason(JobState.FAILED, code, "exit"),
-                raw_state="exit",
+    def resolve_terminal_many(
+        self, scheduler_job_ids: Sequence[str]
+    ) -> dict[str, TerminalStatus]:
+        """Final status of several jobs from a single ``bhist -l`` call.
+
+        Ids with no decidable history are absent from the result.
+        """
+        if not scheduler_job_ids:
+            return {}
+        try:
+            result = self._transport.run(
+                [self._opts.bhist_path, "-l", *scheduler_job_ids],
+                timeout=15,
             )
-        return None
+        except TransportError:
+            return {}
+        # bhist exits non-zero when *any* id is unknown but still prints the
+        # others, so parse whatever came back rather than trusting the code.
+        text = result.stdout
+        starts = list(_BHIST_JOB_RE.finditer(text))
+        wanted = set(scheduler_job_ids)
+        out: dict[str, TerminalStatus] = {}
+        for i, match in enumerate(starts):
+            jid = match.group(1)
+            if jid not in wanted or jid in out:
+                continue
+            end = starts[i + 1].start() if i + 1 < len(starts) else len(text)
+            status = _bhist_terminal(text[match.start() : end].lower())
+            if status is not None:
+                out[jid] = status
+        return out
 
     def list_queue(self, *, user: str | None = None) -> list[QueueEntry]:
         target_user = user or os.environ.get("USER") or ""
@@ -290,3 +300,35 @@ class LSFScheduler:
             mapped["-w"] = f'"{s.dependency}"'
 
         return mapped
+
+
+def _bhist_terminal(lower: str) -> TerminalStatus | None:
+    """Classify one job's lower-cased ``bhist -l`` history."""
+    # `bhist -l` is prose, and it echoes the job's own command line back.
+    # Match the phrases LSF actually emits rather than bare substrings —
+    # a job named "rundone" or a path containing "exit" used to decide the
+    # outcome.
+    if _LSF_KILLED_RE.search(lower):
+        return TerminalStatus(
+            state=JobState.CANCELLED,
+            failure_reason=_default_failure_reason(JobState.CANCELLED, None, "killed"),
+            raw_state="killed",
+        )
+    if _LSF_DONE_RE.search(lower):
+        return TerminalStatus(state=JobState.SUCCEEDED, exit_code=0, raw_state="done")
+    match = _LSF_EXIT_CODE_RE.search(lower)
+    if match is not None or _LSF_EXITED_RE.search(lower):
+        code = int(match.group(1)) if match is not None else None
+        return TerminalStatus(
+            state=JobState.FAILED,
+            exit_code=code,
+            failure_reason=_default_failure_reason(JobState.FAILED, code, "exit"),
+            raw_state="exit",
+        )
+    return None
+
+
+def _only_gone_ids(stderr: str) -> bool:
+    """True iff a failed bjobs only reported job ids it no longer knows."""
+    lines = [line for line in stderr.splitlines() if line.strip()]
+    return bool(lines) and all(line.endswith("is not found") for line in lines)
@@ -23,6 +23,9 @@ from molq.transport import LocalTransport, Transport, TransportError
 
 logger = get_logger(__name__)
 
+# qstat's complaints about ids that have left the queue.
+_QSTAT_GONE_MARKERS = ("Unknown Job Id", "Job has finished")
+
 _PBS_STATE_MAP: dict[str, JobState] = {
     "R": JobState.RUNNING,
     "Q": JobState.QUEUED,
@@ -91,14 +94,15 @@ class PBSScheduler:
 
         # Query specific job IDs directly — O(queried) not O(all user jobs).
         # qstat exits non-zero for unknown/finished jobs; that's fine — those
-        # jobs will be resolved as terminal by the reconciler.
+        # jobs will be resolved as terminal by the reconciler.  Any other
+        # failure (server down, auth) must not be read as an empty queue.
         cmd = [self._opts.qstat_path] + list(scheduler_job_ids)
 
-        try:
-            result = self._transport.run(cmd, timeout=30)
-        except TransportError as e:
-            logger.warning(f"qstat invocation failed: {e}")
-            return {}
+        # A TransportError propagates: "could not ask" must not read as
+        # "every job has left the queue".
+        result = self._transport.run(cmd, timeout=30)
+        if result.returncode != 0 and not _only_gone_ids(result.stderr):
+            raise SchedulerError("qstat failed", stderr=result.stderr, command=cmd)
         if not result.stdout.strip():
             return {}
 
@@ -120,9 +124,12 @@ class PBSScheduler:
         return out
 
     def cancel(self, scheduler_job_id: str) -> None:
+        self.cancel_many([scheduler_job_id])
+
+    def cancel_many(self, scheduler_job_ids: Sequence[str]) -> None:
         try:
             self._transport.run(
-                [self._opts.qdel_path, scheduler_job_id],
+                [self._opts.qdel_path, *scheduler_job_ids],
                 timeout=30,
             )
         except TransportError:
@@ -273,3 +280,11 @@ class PBSScheduler:
             mapped["-W"] = f"depend={s.dependency}"
 
         return mapped
+
+
+def _only_gone_ids(stderr: str) -> bool:
+    """True iff a failed qstat only reported unknown or finished job ids."""
+    lines = [line for line in stderr.splitlines() if line.strip()]
+    return bool(lines) and all(
+        any(marker in line for marker in _QSTAT_GONE_MARKERS) for line in lines
+    )
@@ -9,12 +9,15 @@ from pathlib import Path
 from molq.models import JobSpec
 from molq.status import JobState
 
+# Words the shell reads literally; anything else gets single-quoted.
+_SHELL_SAFE_RE = re.compile(r"[a-zA-Z0-9_/.\-=:@]+")
+
 
 def _shell_quote(s: str) -> str:
     """Quote a string for safe shell usage."""
     if not s:
         return "''"
-    if re.match(r"^[a-zA-Z0-9_/.\-=:@]+$", s):
+    if _SHELL_SAFE_RE.fullmatch(s):
         return s
     return "'" + s.replace("'", "'\"'\"'") + "'"
 
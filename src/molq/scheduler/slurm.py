@@ -39,6 +39,12 @@ _SLURM_STATE_MAP: dict[str, JobState] = {
     "OOM": JobState.FAILED,
 }
 
+# Fixed tail of the poll command; only the job-id list varies per tick.
+_SQUEUE_POLL_ARGS: tuple[str, ...] = ("-h", "-o", "%i %t")
+
+# What squeue prints (exit 1) when none of the requested ids are known any more.
+_SQUEUE_IDS_GONE = "Invalid job id specified"
+
 _SLURM_SACCT_MAP: dict[str, JobState] = {
     "COMPLETED": JobState.SUCCEEDED,
     "FAILED": JobState.FAILED,
@@ -109,44 +115,56 @@ class SlurmScheduler:
                 stderr=result.stderr,
                 command=cmd,
             )
-        return result.stdout.strip().split(";")[0]
+        # --parsable prints "<jobid>[;<cluster>]" as the last line; site
+        # submit plugins may print notices above it.
+        job_id = result.stdout.strip().rpartition("\n")[2].partition(";")[0].strip()
+        if not job_id:
+            raise SchedulerError(
+                "SLURM submission returned no job id",
+                stderr=result.stderr,
+                command=cmd,
+            )
+        return job_id
 
     def poll_many(self, scheduler_job_ids: Sequence[str]) -> dict[str, JobState]:
         if not scheduler_job_ids:
             return {}
 
-        ids_str = ",".join(scheduler_job_ids)
         cmd = [
             self._opts.squeue_path,
             "-j",
-            ids_str,
-            "-h",
-            "-o",
-            "%i %t",
+            ",".join(scheduler_job_ids),
+            *_SQUEUE_POLL_ARGS,
         ]
+        if self._opts.only_job_state:
+            cmd.append("--only-job-state")
 
-        try:
-            result = self._transport.run(cmd, timeout=30)
-        except TransportError as e:
-            logger.warning(f"squeue invocation failed: {e}")
-            return {}
-        if not result.stdout.strip():
-            return {}
+        # A TransportError propagates: "could not ask" must not read as
+        # "every job has left the queue".
+        result = self._transport.run(cmd, timeout=30)
+        # squeue exits 1 both when every queried id has been purged and when
+        # slurmctld is unreachable; only the former means the jobs are gone.
+        if result.returncode != 0:
+            if _SQUEUE_IDS_GONE in result.stderr:
+                return {}
+            raise SchedulerError("squeue failed", stderr=result.stderr, command=cmd)
 
         out: dict[str, JobState] = {}
-        for line in result.stdout.strip().split("\n"):
-            parts = line.split()
+        for line in result.stdout.splitlines():
+            parts = line.split(None, 2)
             if len(parts) >= 2:
-                jid, st = parts[0], parts[1]
-                state = _SLURM_STATE_MAP.get(st)
+                state = _SLURM_STATE_MAP.get(parts[1])
                 if state is not None:
-                    out[jid] = state
+                    out[parts[0]] = state
         return out
 
     def cancel(self, scheduler_job_id: str) -> None:
+        self.cancel_many([scheduler_job_id])
+
+    def cancel_many(self, scheduler_job_ids: Sequence[str]) -> None:
         try:
             self._transport.run(
-                [self._opts.scancel_path, scheduler_job_id],
+                [self._opts.scancel_path, *scheduler_job_ids],
                 timeout=30,
             )
         except TransportError:
@@ -170,23 +188,58 @@ class SlurmScheduler:
             return None
         if result.returncode != 0 or not result.stdout.strip():
             return None
+        parts = result.stdout.strip().split("\n")[0].split("|")
+        return _sacct_terminal(parts[0].strip(), parts[1] if len(parts) > 1 else None)
+
+    def resolve_terminal_many(
+        self, scheduler_job_ids: Sequence[str]
+    ) -> dict[str, TerminalStatus]:
+        """Final status of several jobs from a single ``sacct`` call.
+
+        The reconciler prefers this over one :meth:`resolve_terminal` per job
+        when a cycle sees several jobs leave the queue — each ``sacct`` is a
+        round trip to slurmdbd, and over ssh a round trip to the cluster too.
+        Ids with no usable accounting row are absent from the result.
+        """
+        if not scheduler_job_ids:
+            return {}
         try:
-            first_line = result.stdout.strip().split("\n")[0]
-            parts = first_line.split("|")
-            raw_state = parts[0].strip()
-            state_str = raw_state.split()[0]
-        except IndexError:
-            return None
-        state = _SLURM_SACCT_MAP.get(state_str)
-        if state is None:
-            return None
-        exit_code = _parse_exit_code(parts[1]) if len(parts) > 1 else None
-        return TerminalStatus(
-            state=state,
-            exit_code=exit_code,
-            failure_reason=_default_failure_reason(state, exit_code, raw_state),
-            raw_state=raw_state,
-        )
+            result = self._transport.run(
+                [
+                    self._opts.sacct_path,
+                    "-j",
+                    ",".join(scheduler_job_ids),
+                    "-o",
+                    "JobID,State,ExitCode",
+                    "-n",
+                    "-P",
+                ],
+                timeout=15,
+            )
+        except TransportError:
+            return {}
+        if result.returncode != 0 or not result.stdout.strip():
+            return {}
+
+        wanted = set(scheduler_job_ids)
+        out: dict[str, TerminalStatus] = {}
+        seen: set[str] = set()
+        for line in result.stdout.strip().split("\n"):
+            parts = line.split("|")
+            if len(parts) < 2:
+                continue
+            # Steps ("123.batch") and array tasks ("123_4") report under the
+            # submitted id; like resolve_terminal, the first row per job wins.
+            base = parts[0].strip().split(".")[0].split("_")[0]
+            if base not in wanted or base in seen:
+                continue
+            seen.add(base)
+            status = _sacct_terminal(
+                parts[1].strip(), parts[2] if len(parts) > 2 else None
+            )
+            if status is not None:
+                out[base] = status
+        return out
 
     def list_queue(self, *, user: str | None = None) -> list[QueueEntry]:
         cmd: list[str] = [self._opts.squeue_path, "-h", "-o", "%i|%j|%u|%t|%P|%V|%S"]
@@ -202,11 +255,14 @@ class SlurmScheduler:
         if result.returncode != 0 or not result.stdout.strip():
             return []
         entries: list[QueueEntry] = []
-        for line in result.stdout.strip().split("\n"):
-            parts = line.split("|")
-            if len(parts) < 7:
+        for line in result.stdout.splitlines():
+            # The job name is free text and may itself contain "|": peel the
+            # fixed fields off both ends and leave whatever is between as name.
+            jid, _, rest = line.partition("|")
+            fields = rest.rsplit("|", 5)
+            if len(fields) < 6:
                 continue
-            jid, name, usr, raw_state, part, sub_t, start_t = parts[:7]
+            name, usr, raw_state, part, sub_t, start_t = fields
             entries.append(
                 QueueEntry(
                     scheduler_job_id=jid,
@@ -294,3 +350,21 @@ class SlurmScheduler:
             mapped["reservation"] = s.reservation
 
         return mapped
+
+
+def _sacct_terminal(raw_state: str, exit_field: str | None) -> TerminalStatus | None:
+    """Map one ``sacct`` State/ExitCode pair to a terminal status."""
+    try:
+        state_str = raw_state.split()[0]
+    except IndexError:
+        return None
+    state = _SLURM_SACCT_MAP.get(state_str)
+    if state is None:
+        return None
+    exit_code = _parse_exit_code(exit_field) if exit_field is not None else None
+    return TerminalStatus(
+        state=state,
+        exit_code=exit_code,
+        failure_reason=_default_failure_reason(state, exit_code, raw_state),
+        raw_state=raw_state,
+    )
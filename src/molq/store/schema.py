@@ -106,6 +106,15 @@ CREATE INDEX IF NOT EXISTS idx_job_dependencies_job
 ON job_dependencies(job_id)
 """
 
+# Reverse lookup (who depends on this job?) for get_dependents and the
+# downstream previews; without it each lookup scans the whole table.  Purely
+# additive, so a current-version store that lacks it gets it on open rather
+# than behind a version bump that older molq releases would refuse.
+_CREATE_IDX_DEPENDENTS = """
+CREATE INDEX IF NOT EXISTS idx_job_dependencies_dependency
+ON job_dependencies(dependency_job_id)
+"""
+
 _CREATE_ALLOCATIONS = """
 CREATE TABLE IF NOT EXISTS allocations (
     cluster_name TEXT NOT NULL,
@@ -151,6 +160,7 @@ class SchemaMixin:
             if row:
                 version = row["value"]
                 if version == _SCHEMA_VERSION:
+                    self._ensure_dependents_index()
                     return
                 # Compare numerically: as strings "10" sorts *before* "8",
                 # so a future schema would be misreported as unknown rather
@@ -180,6 +190,21 @@ class SchemaMixin:
         # Fresh database or needs schema creation
         self._create_schema()
 
+    def _ensure_dependents_index(self) -> None:
+        """Add the dependents index if missing, without writing otherwise.
+
+        Opening a store happens on every CLI call, including read-only ones;
+        an unconditional ``CREATE INDEX IF NOT EXISTS`` would still start a
+        write transaction each time.
+        """
+        row = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='index' "
+            "AND name='idx_job_dependencies_dependency'"
+        ).fetchone()
+        if row is None:
+            self._conn.execute(_CREATE_IDX_DEPENDENTS)
+            self._conn.commit()
+
     def _has_old_schema(self) -> bool:
         """Check if this is a v1 database (has 'jobs' table but no 'molq_meta')."""
         try:
@@ -252,6 +277,7 @@ class SchemaMixin:
                 self._conn.execute(_CREATE_IDX_ROOT_ATTEMPT)
                 self._conn.execute(_CREATE_IDX_RETRY_GROUP)
                 self._conn.execute(_CREATE_IDX_DEPENDENCIES)
+                self._conn.execute(_CREATE_IDX_DEPENDENTS)
                 self._conn.execute(_CREATE_IDX_ALLOCATIONS)
                 self._conn.execute(
                     "INSERT OR REPLACE INTO molq_meta (key, value) VALUES (?, ?)",
@@ -308,6 +334,7 @@ class SchemaMixin:
                 self._conn.execute(_CREATE_IDX_ROOT_ATTEMPT)
                 self._conn.execute(_CREATE_IDX_RETRY_GROUP)
                 self._conn.execute(_CREATE_IDX_DEPENDENCIES)
+                self._conn.execute(_CREATE_IDX_DEPENDENTS)
                 self._conn.execute(_CREATE_IDX_ALLOCATIONS)
                 self._conn.execute(
                     "INSERT OR REPLACE INTO molq_meta (key, value) VALUES (?, ?)",
@@ -335,5 +362,6 @@ class SchemaMixin:
             self._conn.execute(_CREATE_IDX_ROOT_ATTEMPT)
             self._conn.execute(_CREATE_IDX_RETRY_GROUP)
             self._conn.execute(_CREATE_IDX_DEPENDENCIES)
+            self._conn.execute(_CREATE_IDX_DEPENDENTS)
             self._conn.execute(_CREATE_IDX_ALLOCATIONS)
             self._conn.commit()
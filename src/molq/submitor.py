@@ -7,6 +7,7 @@ and management) and JobHandle (lightweight handle for a submitted job).
 from __future__ import annotations
 
 import time
+from collections.abc import Mapping, Sequence
 from dataclasses import replace
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -24,6 +25,7 @@ from molq.dependencies import (
 from molq.errors import (
     JobNotFoundError,
     ScriptError,
+    SubmitError,
 )
 from molq.handle import JobHandle
 from molq.merge import merge_defaults
@@ -86,6 +88,9 @@ class Submitor:
         plugins: Official or third-party plugin names to attach (e.g.
             ``["nerve"]``).  Empty/omitted means no plugins.
         plugin_configs: Per-plugin config dicts (from ``[plugins.<name>]``).
+        poll_ttl: Seconds a scheduler answer stays fresh.  Status refreshes
+            within that window reuse it instead of querying the scheduler
+            again.  ``0`` (the default) queries on every refresh.
     """
 
     # Always set after __init__; close() flips to None as an escape hatch
@@ -106,6 +111,7 @@ class Submitor:
         event_bus: EventBus | None = None,
         plugins: list[str] | None = None,
         plugin_configs: dict[str, dict[str, Any]] | None = None,
+        poll_ttl: float = 0.0,
     ) -> None:
         from molq.cluster import Cluster
 
@@ -140,8 +146,10 @@ class Submitor:
             jobs_dir=self._jobs_dir,
             event_bus=self._event_bus,
             on_terminal=self._handle_terminal_record,
+            poll_ttl=poll_ttl,
         )
         self._monitor: JobMonitor | None = None
+        self._capabilities: SchedulerCapabilities | None = None
 
         if plugins:
             self._attach_plugins(plugins, plugin_configs or {})
@@ -196,7 +204,9 @@ class Submitor:
     @property
     def _monitor_instance(self) -> JobMonitor:
         if self._monitor is None:
-            self._monitor = JobMonitor(self._reconciler, self._store)
+            self._monitor = JobMonitor(
+                self._reconciler, self._store, event_bus=self._event_bus
+            )
         return self._monitor
 
     # ------------------------------------------------------------------
@@ -259,6 +269,94 @@ class Submitor:
         )
         return handle
 
+    def submit_jobs(
+        self,
+        requests: Sequence[Mapping[str, Any]],
+        *,
+        max_workers: int = 8,
+        max_in_flight: int | None = None,
+    ) -> list[JobHandle]:
+        """Submit several independent jobs concurrently.
+
+        Each entry of *requests* holds the keyword arguments of one
+        :meth:`submit_job` call.  ``sbatch``/``qsub``/``bsub`` and their ssh
+        round trips are I/O-bound, so up to *max_workers* submissions are in
+        flight at once and N jobs cost roughly N / max_workers submit
+        latencies instead of N.
+
+        With *max_in_flight*, submission also waits whenever that many of this
+        cluster's jobs are active, and resumes as they finish.  Use it to stay
+        under a per-user queue limit instead of having the scheduler reject
+        the overflow.
+
+        Handles come back in the order of *requests*.  If any submission
+        raises, every other submission still completes and the first error is
+        re-raised afterwards; jobs that did submit are in the store as usual.
+        Jobs that depend on each other belong in separate calls, since a
+        dependency needs the upstream job id.
+
+        Raises:
+            ValueError: If *max_in_flight* is less than 1.
+            SubmitError: If the Submitor is closed while waiting for capacity.
+                ``context["submitted"]`` holds the handles of the jobs already
+                submitted, ``context["pending"]`` the count left unsubmitted.
+        """
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be >= 1, got {max_in_flight}")
+        if not requests:
+            return []
+        if max_in_flight is None and (max_workers <= 1 or len(requests) == 1):
+            handles: list[JobHandle] = []
+            first_error: Exception | None = None
+            for request in requests:
+                try:
+                    handles.append(self.submit_job(**request))
+                except Exception as exc:
+                    if first_error is None:
+                        first_error = exc
+            if first_error is not None:
+                raise first_error
+            return handles
+
+        from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+        futures: list[Future[JobHandle]] = []
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(requests))),
+            thread_name_prefix="molq-submit",
+        ) as pool:
+            if max_in_flight is None:
+                futures = [
+                    pool.submit(self.submit_job, **request) for request in requests
+                ]
+            else:
+                # Submit in waves sized to the free slots; each wave is in the
+                # store before the next capacity check, so none are counted
+                # twice or missed.
+                remaining = list(requests)
+                while remaining:
+                    free = self._monitor_instance.wait_for_capacity(
+                        self._target.name, max_in_flight
+                    )
+                    if free == 0:
+                        raise SubmitError(
+                            "Submitor closed while waiting for capacity",
+                            pending=len(remaining),
+                            submitted=[
+                                future.result()
+                                for future in futures
+                                if future.exception() is None
+                            ],
+                        )
+                    wave = [
+                        pool.submit(self.submit_job, **request)
+                        for request in remaining[:free]
+                    ]
+                    wait(wave)
+                    futures.extend(wave)
+                    remaining = remaining[free:]
+        return [future.result() for future in futures]
+
     def get_job(self, job_id: str) -> JobRecord:
         """Get a job record by ID.
 
@@ -350,29 +448,51 @@ class Submitor:
 
     def cancel_job(self, job_id: str) -> None:
         """Cancel a job."""
-        record = self._store.get_latest_attempt_record(job_id)
-        if record is None:
-            raise JobNotFoundError(job_id, self._target.name)
+        self.cancel_jobs([job_id])
 
-        if record.scheduler_job_id:
-            self._scheduler_impl.cancel(record.scheduler_job_id)
+    def cancel_jobs(self, job_ids: Sequence[str]) -> None:
+        """Cancel several jobs, in one scheduler call where the backend can.
+
+        Every id is looked up before anything is cancelled, so an unknown id
+        raises :class:`JobNotFoundError` without touching the others.
+        """
+        records = []
+        for job_id in job_ids:
+            record = self._store.get_latest_attempt_record(job_id)
+            if record is None:
+                raise JobNotFoundError(job_id, self._target.name)
+            records.append(record)
+
+        scheduler_ids = [r.scheduler_job_id for r in records if r.scheduler_job_id]
+        # Backends that can cancel several jobs in one command (scancel,
+        # qdel, bkill, kill all take a list) get them batched; a teardown of
+        # N jobs is then one round trip instead of N.
+        cancel_many = getattr(type(self._scheduler_impl), "cancel_many", None)
+        if callable(cancel_many) and len(scheduler_ids) > 1:
+            cancel_many(self._scheduler_impl, scheduler_ids)
+        else:
+            for scheduler_job_id in scheduler_ids:
+                self._scheduler_impl.cancel(scheduler_job_id)
 
         now = time.time()
-        self._store.update_job(record.job_id, state=JobState.CANCELLED, finished_at=now)
-        self._store.record_transition(
-            record.job_id,
-            record.state,
-            JobState.CANCELLED,
-            now,
-            "cancelled by user",
-        )
-        self._emit_status_change(
-            job_id=record.job_id,
-            old_state=record.state,
-            new_state=JobState.CANCELLED,
-            timestamp=now,
-            reason="cancelled by user",
-        )
+        for record in records:
+            self._store.update_job(
+                record.job_id, state=JobState.CANCELLED, finished_at=now
+            )
+            self._store.record_transition(
+                record.job_id,
+                record.state,
+                JobState.CANCELLED,
+                now,
+                "cancelled by user",
+            )
+            self._emit_status_change(
+                job_id=record.job_id,
+                old_state=record.state,
+                new_state=JobState.CANCELLED,
+                timestamp=now,
+                reason="cancelled by user",
+            )
 
     def refresh_jobs(self) -> None:
         """Reconcile all active jobs with the scheduler."""
@@ -454,15 +574,27 @@ class Submitor:
         *,
         once: bool = False,
         interval: float = 5.0,
+        max_interval: float | None = None,
         run_cleanup: bool = True,
     ) -> None:
+        """Reconcile (and optionally clean up) in a loop until interrupted.
+
+        Cycles run every *interval* seconds.  Given a larger *max_interval*,
+        the pause instead doubles, up to *max_interval*, for every cycle in
+        which no job changed state; any change drops it back to *interval*.
+        Queues that sit unchanged for hours are then polled rarely without
+        delaying updates once they start moving.
+        """
+        cap = interval if max_interval is None else max(interval, max_interval)
+        delay = 0.0
         while True:
-            self.refresh_jobs()
+            changes = self._reconciler.reconcile()
             if run_cleanup:
                 self.cleanup_jobs(dry_run=False)
             if once:
                 return
-            time.sleep(interval)
+            delay = interval if changes or not delay else min(delay * 2, cap)
+            time.sleep(delay)
 
     def close(self) -> None:
         """Release plugins and this Submitor's :class:`JobStore` connection.
@@ -477,6 +609,10 @@ class Submitor:
         mgr = getattr(self, "_plugin_manager", None)
         if mgr is not None:
             mgr.detach_all()
+        monitor = getattr(self, "_monitor", None)
+        if monitor is not None:
+            monitor.close()
+            self._monitor = None
         store = getattr(self, "_store", None)
         if store is not None:
             if getattr(self, "_owns_store", False):
@@ -636,12 +772,10 @@ class Submitor:
             scheduler_name=self._target.scheduler,
         )
 
-        job_dir = jobpaths.prepare_job_dir(
-            self._transport, self._jobs_dir, job_id, cwd, dir_name
-        )
+        jobpaths.prepare_job_dir(self._transport, job_dir)
         if cmd.script is not None and cmd.script.variant == "path":
             jobpaths.materialize_script(self._transport, cmd.script, job_dir)
-        jobpaths.write_manifest(self._transport, self._jobs_dir, spec, time.time())
+        jobpaths.write_manifest(self._transport, job_dir, spec, time.time())
         self._store.insert_job(spec)
         if dependencies:
             self._store.add_dependencies(
@@ -726,9 +860,14 @@ class Submitor:
         )
 
     def _scheduler_capabilities(self) -> SchedulerCapabilities:
-        if hasattr(self._scheduler_impl, "capabilities"):
-            return self._scheduler_impl.capabilities()
-        return default_capabilities()
+        # A backend's support matrix is fixed for its lifetime; resolve it
+        # once instead of rebuilding it twice per submission.
+        if self._capabilities is None:
+            if hasattr(self._scheduler_impl, "capabilities"):
+                self._capabilities = self._scheduler_impl.capabilities()
+            else:
+                self._capabilities = default_capabilities()
+        return self._capabilities
 
     def _emit_status_change(
         self,
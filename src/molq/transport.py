@@ -36,6 +36,11 @@ from molq.options import SshTransportOptions
 
 logger = get_logger(__name__)
 
+# Decode command output as UTF-8 rather than the locale's encoding: HPC login
+# nodes and cron jobs often run under LANG=C, where a non-ASCII job name or
+# stderr line would otherwise raise UnicodeDecodeError inside subprocess.
+_OUTPUT_ENCODING = "utf-8"
+
 
 # ---------------------------------------------------------------------------
 # Errors and result type
@@ -50,7 +55,7 @@ class TransportError(MolqError):
     """
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandResult:
     """Result of :meth:`Transport.run`.
 
@@ -170,6 +175,8 @@ class LocalTransport:
                 input=input,
                 capture_output=True,
                 text=True,
+                encoding=_OUTPUT_ENCODING,
+                errors="replace",
                 check=False,
                 timeout=timeout,
             )
@@ -382,6 +389,10 @@ def _host_configures_control_path(host: str, ssh_bin: str = "ssh") -> bool:
     return False
 
 
+# home directory -> verified ControlPath template; see _ssh_control_path.
+_CONTROL_PATHS: dict[str, str] = {}
+
+
 def _ssh_control_path() -> str | None:
     """Return a ControlPath template, or ``None`` if one can't be provided.
 
@@ -389,9 +400,27 @@ def _ssh_control_path() -> str | None:
     layout other OpenSSH tooling uses — one well-known private directory per
     user rather than a molq-specific subdirectory.  ``%C`` is a hash of the
     connection tuple, so distinct hosts never share a socket.
+
+    Successful results are cached per home directory: every remote operation
+    builds an ssh argv, and re-checking ``~/.ssh`` each time cost a mkdir and
+    a stat per call.  Failures are not cached, so a transient mkdir error is
+    retried on the next call.  Keying on the home directory keeps a changed
+    ``$HOME`` (tests, sudo -E) honoured.
     """
+    home = str(Path.home())
+    cached = _CONTROL_PATHS.get(home)
+    if cached is not None:
+        return cached
+    template = _control_path_under(home)
+    if template is not None:
+        _CONTROL_PATHS[home] = template
+    return template
+
+
+def _control_path_under(home: str) -> str | None:
+    """:func:`_ssh_control_path` for a given home directory, uncached."""
     uid = getattr(os, "getuid", lambda: 0)()
-    ssh_dir = Path.home() / ".ssh"
+    ssh_dir = Path(home) / ".ssh"
     template = str(ssh_dir / "molq-%C")
     if len(template) + _CONTROL_TOKEN_GROWTH > _SOCKET_PATH_BUDGET:
         logger.debug(f"ssh ControlPath would exceed socket limit: {template}")
@@ -538,16 +567,27 @@ class SshTransport:
     def _remote_target(self, path: str) -> str:
         return f"{self.options.host}:{path}"
 
-    def _shell(
-        self, remote_cmd: str, *, input: str | None = None, timeout: float | None = None
-    ) -> CommandResult:
-        """Run *remote_cmd* (a single shell string) on the remote via ssh."""
+    def _run_ssh(
+        self,
+        remote_cmd: str,
+        *,
+        input: str | None = None,
+        timeout: float | None = None,
+        text: bool = True,
+    ) -> tuple[list[str], subprocess.CompletedProcess]:
+        """Run *remote_cmd* via ssh; return the argv and the raw process result.
+
+        ``text=False`` keeps both pipes binary, for callers that want the
+        remote bytes exactly as written.
+        """
         argv = self._ssh_argv() + ["--", remote_cmd]
         try:
             proc = subprocess.run(
                 argv,
                 capture_output=True,
-                text=True,
+                text=text,
+                encoding=_OUTPUT_ENCODING if text else None,
+                errors="replace" if text else None,
                 check=False,
                 input=input,
                 timeout=timeout,
@@ -563,6 +603,13 @@ class SshTransport:
                 "ssh binary not found — install OpenSSH client",
                 ssh_bin=self._ssh_bin,
             ) from exc
+        return argv, proc
+
+    def _shell(
+        self, remote_cmd: str, *, input: str | None = None, timeout: float | None = None
+    ) -> CommandResult:
+        """Run *remote_cmd* (a single shell string) on the remote via ssh."""
+        argv, proc = self._run_ssh(remote_cmd, input=input, timeout=timeout)
         return CommandResult(
             argv=tuple(argv),
             returncode=proc.returncode,
@@ -597,22 +644,20 @@ class SshTransport:
         return self.read_bytes(path).decode("utf-8")
 
     def read_bytes(self, path: str) -> bytes:
-        # Use base64 so we don't have to worry about embedded NULs / non-UTF8.
-        # Feed it on stdin rather than as an argument: BSD/macOS base64 takes
-        # only -i/stdin, so `base64 -- <file>` fails against a macOS host.
-        result = self._shell(f"base64 < {self._quote_remote_path(path)}")
-        if result.returncode != 0:
-            if (
-                "No such file" in result.stderr
-                or "cannot open" in result.stderr.lower()
-            ):
+        # Binary pipe: ssh carries NULs and non-UTF8 bytes untouched when no
+        # TTY is allocated, so plain `cat` beats base64 — no 4/3 inflation on
+        # the wire and no text decode + b64decode pass on this side.
+        _, proc = self._run_ssh(f"cat -- {self._quote_remote_path(path)}", text=False)
+        if proc.returncode != 0:
+            stderr = (proc.stderr or b"").decode("utf-8", errors="replace")
+            if "No such file" in stderr or "cannot open" in stderr.lower():
                 raise FileNotFoundError(path)
             raise TransportError(
                 f"remote read failed: {path}",
-                returncode=result.returncode,
-                stderr=result.stderr,
+                returncode=proc.returncode,
+                stderr=stderr,
             )
-        return base64.b64decode(result.stdout)
+        return proc.stdout or b""
 
     def write_text(self, path: str, data: str, *, mode: int = 0o600) -> None:
         self.write_bytes(path, data.encode("utf-8"), mode=mode)
@@ -829,7 +874,13 @@ class SshTransport:
         argv += [src, dst]
         try:
             proc = subprocess.run(
-                argv, capture_output=True, text=True, check=False, timeout=None
+                argv,
+                capture_output=True,
+                text=True,
+                encoding=_OUTPUT_ENCODING,
+                errors="replace",
+                check=False,
+                timeout=None,
             )
         except FileNotFoundError as exc:
             raise TransportError(
@@ -1,7 +1,7 @@
 """Public value types for molq.
 
 Provides Memory, Duration, Script, DependencyRef, JobResources, JobScheduling,
-and JobExecution. All types are frozen (immutable) dataclasses.
+and JobExecution. All types are frozen (immutable), slotted dataclasses.
 """
 
 from __future__ import annotations
@@ -33,7 +33,7 @@ _MEMORY_UNITS: dict[str, int] = {
 _MEMORY_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]*)\s*$")
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Memory:
     """Immutable memory quantity stored as bytes."""
 
@@ -115,7 +115,7 @@ _TIME_UNITS: dict[str, int] = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 6048
 _DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*([smhdw])", re.IGNORECASE)
 
 
-@dataclass(frozen=True, order=True)
+@dataclass(frozen=True, order=True, slots=True)
 class Duration:
     """Immutable time duration stored as seconds."""
 
@@ -204,7 +204,7 @@ class Duration:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Script:
     """Immutable script reference — either inline text or a file path."""
 
@@ -241,7 +241,7 @@ class Script:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DependencyRef:
     """Logical dependency on another molq job."""
 
@@ -249,7 +249,7 @@ class DependencyRef:
     condition: DependencyCondition = "after_success"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobResources:
     """Hardware requirements for job execution."""
 
@@ -260,7 +260,7 @@ class JobResources:
     time_limit: Duration | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobScheduling:
     """Scheduler-level parameters."""
 
@@ -284,7 +284,7 @@ class JobScheduling:
             )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobExecution:
     """Execution environment parameters."""
 
@@ -119,6 +119,15 @@ class TestJobRecord:
         with pytest.raises(dataclasses.FrozenInstanceError):
             r.state = JobState.RUNNING  # type: ignore[misc]
 
+    def test_no_instance_dict(self):
+        r = JobRecord(
+            job_id="x",
+            cluster_name="c",
+            scheduler="local",
+            state=JobState.CREATED,
+        )
+        assert not hasattr(r, "__dict__")
+
 
 class TestSubmitorDefaults:
     def test_all_none(self):
@@ -74,6 +74,32 @@ class TestWaitOne:
         record = monitor.wait_one("j1")
         assert record.state == JobState.SUCCEEDED
 
+    def test_backoff_restarts_on_state_change(self, store):
+        _insert_job(store)
+        store.update_job("j1", state=JobState.QUEUED)
+
+        mock_scheduler = MagicMock()
+        mock_scheduler.poll_many.side_effect = [
+            {"s1": JobState.QUEUED},
+            {"s1": JobState.QUEUED},
+            {"s1": JobState.RUNNING},
+            {"s1": JobState.RUNNING},
+            {"s1": JobState.SUCCEEDED},
+        ]
+        mock_scheduler.resolve_terminal.return_value = None
+        polls: list[int] = []
+
+        class RecordingStrategy:
+            def next_interval(self, elapsed: float, poll_count: int) -> float:
+                polls.append(poll_count)
+                return 0.001
+
+        reconciler = JobReconciler(mock_scheduler, store, "dev")
+        monitor = JobMonitor(reconciler, store, strategy=RecordingStrategy())
+
+        assert monitor.wait_one("j1").state == JobState.SUCCEEDED
+        assert polls == [0, 1, 0, 1]
+
 
 class TestWaitMany:
     def test_waits_for_all(self, store):
@@ -112,3 +138,127 @@ class TestWaitMany:
 
         with pytest.raises(MolqTimeoutError):
             monitor.wait_many(["j1"], "dev", timeout=0.05)
+
+
+class TestWakeOnTransition:
+    def test_terminal_event_cuts_the_backoff_short(self, store):
+        import threading
+        import time
+
+        from molq.callbacks import EventBus
+
+        _insert_job(store)
+        mock_scheduler = MagicMock()
+        mock_scheduler.poll_many.return_value = {"s1": JobState.RUNNING}
+        mock_scheduler.resolve_terminal.return_value = None
+
+        bus = EventBus()
+        reconciler = JobReconciler(mock_scheduler, store, "dev", event_bus=bus)
+        monitor = JobMonitor(
+            reconciler, store, strategy=FixedStrategy(60), event_bus=bus
+        )
+
+        def finish_elsewhere():
+            time.sleep(0.1)
+            mock_scheduler.poll_many.return_value = {"s1": JobState.SUCCEEDED}
+            reconciler.reconcile()
+
+        helper = threading.Thread(target=finish_elsewhere)
+        helper.start()
+        started = time.monotonic()
+        record = monitor.wait_one("j1", timeout=30)
+        # The wake-up fires mid-reconcile; let it finish before the store
+        # fixture closes the connection under it.
+        helper.join()
+
+        assert record.state == JobState.SUCCEEDED
+        assert time.monotonic() - started < 10
+
+    def test_transition_during_reconcile_is_not_lost(self, store):
+        import time
+
+        from molq.callbacks import EventBus
+
+        _insert_job(store)
+        mock_scheduler = MagicMock()
+        mock_scheduler.poll_many.return_value = {"s1": JobState.SUCCEEDED}
+        mock_scheduler.resolve_terminal.return_value = None
+
+        bus = EventBus()
+        reconciler = JobReconciler(mock_scheduler, store, "dev", event_bus=bus)
+        monitor = JobMonitor(
+            reconciler, store, strategy=FixedStrategy(60), event_bus=bus
+        )
+        real_reconcile_one = reconciler.reconcile_one
+        calls = []
+
+        def stale_then_real(job_id):
+            calls.append(job_id)
+            if len(calls) == 1:
+                # Another thread records the completion after this poll
+                # read the scheduler, so this caller still sees RUNNING.
+                reconciler.reconcile()
+                return JobState.RUNNING
+            return real_reconcile_one(job_id)
+
+        reconciler.reconcile_one = stale_then_real
+        started = time.monotonic()
+        record = monitor.wait_one("j1", timeout=30)
+
+        assert record.state == JobState.SUCCEEDED
+        assert time.monotonic() - started < 10
+
+    def test_unrelated_terminal_event_does_not_wake(self, store):
+        import threading
+        import time
+
+        from molq.callbacks import EventBus
+
+        _insert_job(store, "j1")
+        _insert_job(store, "j2")
+        store.update_job("j2", scheduler_job_id="s2")
+        mock_scheduler = MagicMock()
+        mock_scheduler.poll_many.return_value = {
+            "s1": JobState.RUNNING,
+            "s2": JobState.RUNNING,
+        }
+        mock_scheduler.resolve_terminal.return_value = None
+
+        bus = EventBus()
+        reconciler = JobReconciler(mock_scheduler, store, "dev", event_bus=bus)
+        monitor = JobMonitor(
+            reconciler, store, strategy=FixedStrategy(60), event_bus=bus
+        )
+        reconcile_one = MagicMock(wraps=reconciler.reconcile_one)
+        reconciler.reconcile_one = reconcile_one
+
+        def finish_both():
+            time.sleep(0.1)
+            mock_scheduler.poll_many.return_value = {
+                "s1": JobState.RUNNING,
+                "s2": JobState.SUCCEEDED,
+            }
+            reconciler.reconcile()
+            time.sleep(0.2)
+            mock_scheduler.poll_many.return_value = {"s1": JobState.SUCCEEDED}
+            reconciler.reconcile()
+
+        helper = threading.Thread(target=finish_both)
+        helper.start()
+        record = monitor.wait_one("j1", timeout=30)
+        helper.join()
+
+        assert record.state == JobState.SUCCEEDED
+        # One poll up front and one after j1's own wake-up; j2 finishing
+        # in between did not cost an extra scheduler query.
+        assert reconcile_one.call_count == 2
+
+    def test_close_unsubscribes(self, store):
+        from molq.callbacks import EventBus, EventType
+
+        bus = EventBus()
+        reconciler = JobReconciler(MagicMock(), store, "dev", event_bus=bus)
+        monitor = JobMonitor(reconciler, store, event_bus=bus)
+        monitor.close()
+
+        assert bus._handlers[EventType.STATUS_CHANGE] == ()
@@ -32,6 +32,7 @@ class TestSlurmSchedulerOptions:
         assert opts.scancel_path == "scancel"
         assert opts.sacct_path == "sacct"
         assert opts.extra_sbatch_flags == ()
+        assert opts.only_job_state is False
 
     def test_custom_paths(self):
         opts = SlurmSchedulerOptions(
@@ -137,6 +137,105 @@ class TestReconcile:
         changes = reconciler.reconcile()
         assert len(changes) == 2
 
+    def test_disappeared_jobs_resolved_in_one_batch(self, store):
+        _insert_job(store, "j1", "s1")
+        _insert_job(store, "j2", "s2")
+
+        class BatchingScheduler:
+            def __init__(self) -> None:
+                self.batches: list[list[str]] = []
+
+            def poll_many(self, scheduler_job_ids):
+                return {}
+
+            def resolve_terminal_many(self, scheduler_job_ids):
+                self.batches.append(sorted(scheduler_job_ids))
+                return {"s1": JobState.SUCCEEDED}
+
+            def resolve_terminal(self, scheduler_job_id):
+                raise AssertionError("should have been batched")
+
+        scheduler = BatchingScheduler()
+        JobReconciler(scheduler, store, "dev").reconcile()
+
+        assert scheduler.batches == [["s1", "s2"]]
+        assert store.get_record("j1").state == JobState.SUCCEEDED
+        # No accounting row for s2: same outcome as a per-job miss.
+        assert store.get_record("j2").state == JobState.LOST
+
+    def test_unreachable_scheduler_keeps_states(self, store, mock_scheduler):
+        from molq.transport import TransportError
+
+        _insert_job(store)
+        mock_scheduler.poll_many.side_effect = TransportError("ssh timed out")
+
+        reconciler = JobReconciler(mock_scheduler, store, "dev")
+        assert reconciler.reconcile() == []
+        assert reconciler.reconcile_one("j1") == JobState.SUBMITTED
+
+        # Not mistaken for an empty queue: nothing resolved, nothing LOST.
+        mock_scheduler.resolve_terminal.assert_not_called()
+        assert store.get_record("j1").state == JobState.SUBMITTED
+
+    def test_unreachable_controller_keeps_states(self, store):
+        from unittest.mock import MagicMock
+
+        from molq.scheduler import SlurmScheduler
+        from molq.transport import CommandResult
+
+        _insert_job(store)
+        transport = MagicMock()
+        transport.run.return_value = CommandResult(
+            argv=("squeue",),
+            returncode=1,
+            stdout="",
+            stderr="slurm_load_jobs error: Unable to contact slurm controller "
+            "(connect failure)\n",
+        )
+
+        reconciler = JobReconciler(SlurmScheduler(transport=transport), store, "dev")
+        assert reconciler.reconcile() == []
+
+        # Only the squeue call was made; sacct was never asked to resolve.
+        transport.run.assert_called_once()
+        assert store.get_record("j1").state == JobState.SUBMITTED
+
+
+class TestPollTtl:
+    def test_repeat_refresh_within_ttl_reuses_answer(self, store, mock_scheduler):
+        _insert_job(store)
+        mock_scheduler.poll_many.return_value = {"s1": JobState.RUNNING}
+
+        reconciler = JobReconciler(mock_scheduler, store, "dev", poll_ttl=60)
+        reconciler.reconcile()
+        reconciler.reconcile()
+        assert reconciler.reconcile_one("j1") == JobState.RUNNING
+
+        mock_scheduler.poll_many.assert_called_once()
+
+    def test_only_stale_jobs_are_queried(self, store, mock_scheduler):
+        _insert_job(store, "j1", "s1")
+        mock_scheduler.poll_many.return_value = {"s1": JobState.RUNNING}
+        reconciler = JobReconciler(mock_scheduler, store, "dev", poll_ttl=60)
+        reconciler.reconcile()
+
+        _insert_job(store, "j2", "s2")
+        mock_scheduler.poll_many.return_value = {"s2": JobState.RUNNING}
+        reconciler.reconcile()
+
+        assert mock_scheduler.poll_many.call_args[0][0] == ["s2"]
+        assert store.get_record("j1").state == JobState.RUNNING
+
+    def test_zero_ttl_always_queries(self, store, mock_scheduler):
+        _insert_job(store)
+        mock_scheduler.poll_many.return_value = {"s1": JobState.RUNNING}
+
+        reconciler = JobReconciler(mock_scheduler, store, "dev")
+        reconciler.reconcile()
+        reconciler.reconcile()
+
+        assert mock_scheduler.poll_many.call_count == 2
+
 
 class TestReconcileOne:
     def test_reconcile_one(self, store, mock_scheduler):
@@ -116,6 +116,21 @@ class TestSlurmScheduler:
             scheduler.submit(spec, job_dir)
         assert exc_info.value.stderr == "error: invalid partition"
 
+    @patch("molq.transport.subprocess.run")
+    def test_submit_reads_id_from_last_line(self, mock_run, tmp_path: Path):
+        mock_run.return_value = MagicMock(
+            stdout="NOTICE: project quota at 91%\n12345;cluster-a\n",
+            stderr="",
+            returncode=0,
+        )
+        assert SlurmScheduler().submit(_make_spec(), tmp_path) == "12345"
+
+    @patch("molq.transport.subprocess.run")
+    def test_submit_without_job_id_raises(self, mock_run, tmp_path: Path):
+        mock_run.return_value = MagicMock(stdout="\n", stderr="", returncode=0)
+        with pytest.raises(SchedulerError, match="no job id"):
+            SlurmScheduler().submit(_make_spec(), tmp_path)
+
     @patch("molq.transport.subprocess.run")
     def test_poll_many(self, mock_run):
         mock_run.return_value = MagicMock(stdout="12345 R\n12346 PD\n", returncode=0)
@@ -124,12 +139,43 @@ class TestSlurmScheduler:
         assert result["12345"] == JobState.RUNNING
         assert result["12346"] == JobState.QUEUED
 
+    @patch("molq.transport.subprocess.run")
+    def test_poll_many_only_job_state_is_opt_in(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="12345 R\n", returncode=0)
+
+        SlurmScheduler().poll_many(["12345"])
+        assert "--only-job-state" not in mock_run.call_args[0][0]
+
+        opts = SlurmSchedulerOptions(only_job_state=True)
+        result = SlurmScheduler(opts).poll_many(["12345"])
+        assert "--only-job-state" in mock_run.call_args[0][0]
+        assert result == {"12345": JobState.RUNNING}
+
     @patch("molq.transport.subprocess.run")
     def test_poll_many_empty(self, mock_run):
         mock_run.return_value = MagicMock(stdout="", returncode=0)
         scheduler = SlurmScheduler()
         assert scheduler.poll_many(["12345"]) == {}
 
+    @patch("molq.transport.subprocess.run")
+    def test_poll_many_purged_ids_are_gone(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout="",
+            stderr="slurm_load_jobs error: Invalid job id specified\n",
+            returncode=1,
+        )
+        assert SlurmScheduler().poll_many(["12345"]) == {}
+
+    @patch("molq.transport.subprocess.run")
+    def test_poll_many_unreachable_controller_raises(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout="",
+            stderr="slurm_load_jobs error: Unable to contact slurm controller\n",
+            returncode=1,
+        )
+        with pytest.raises(SchedulerError, match="squeue failed"):
+            SlurmScheduler().poll_many(["12345"])
+
     @patch("molq.transport.subprocess.run")
     def test_resolve_terminal_completed(self, mock_run):
         mock_run.return_value = MagicMock(stdout="COMPLETED|0:0\n", returncode=0)
@@ -154,6 +200,28 @@ class TestSlurmScheduler:
         assert result.state == JobState.TIMED_OUT
         assert result.failure_reason is not None
 
+    @patch("molq.transport.subprocess.run")
+    def test_resolve_terminal_many_is_one_sacct_call(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout=(
+                "101|COMPLETED|0:0\n"
+                "101.batch|COMPLETED|0:0\n"
+                "102|FAILED|2:0\n"
+                "102.batch|FAILED|2:0\n"
+                "103_1|CANCELLED by 42|0:15\n"
+            ),
+            returncode=0,
+        )
+        result = SlurmScheduler().resolve_terminal_many(["101", "102", "103", "104"])
+
+        mock_run.assert_called_once()
+        assert "101,102,103,104" in mock_run.call_args[0][0]
+        assert result["101"].state == JobState.SUCCEEDED
+        assert result["102"].state == JobState.FAILED
+        assert result["102"].exit_code == 2
+        assert result["103"].state == JobState.CANCELLED
+        assert "104" not in result
+
     @patch("molq.transport.subprocess.run")
     def test_submit_script_path_uses_materialized_script(
         self, mock_run, tmp_path: Path
@@ -176,6 +244,25 @@ class TestSlurmScheduler:
         script = (job_dir / "run_slurm.sh").read_text()
         assert f"bash {job_dir / 'user_script.sh'}" in script
 
+    @patch("molq.transport.subprocess.run")
+    def test_array_job_is_one_sbatch_call(self, mock_run, tmp_path: Path):
+        mock_run.return_value = MagicMock(stdout="12345\n", stderr="", returncode=0)
+        scheduler = SlurmScheduler()
+        spec = JobSpec(
+            job_id="array-id",
+            cluster_name="alpha",
+            scheduler="slurm",
+            command=Command.from_submit_args(argv=["python", "task.py"]),
+            scheduling=JobScheduling(array_spec="1-100:5"),
+        )
+        job_dir = tmp_path / "job"
+        job_dir.mkdir()
+
+        assert scheduler.submit(spec, job_dir) == "12345"
+        mock_run.assert_called_once()
+        script = (job_dir / "run_slurm.sh").read_text()
+        assert "#SBATCH --array=1-100:5" in script
+
     @patch("molq.transport.subprocess.run")
     def test_cancel(self, mock_run):
         scheduler = SlurmScheduler()
@@ -183,6 +270,12 @@ class TestSlurmScheduler:
         mock_run.assert_called_once()
         assert "12345" in mock_run.call_args[0][0]
 
+    @patch("molq.transport.subprocess.run")
+    def test_cancel_many_is_one_scancel(self, mock_run):
+        SlurmScheduler().cancel_many(["1", "2", "3"])
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["scancel", "1", "2", "3"]
+
     def test_custom_options(self):
         opts = SlurmSchedulerOptions(sbatch_path="/opt/slurm/bin/sbatch")
         scheduler = SlurmScheduler(opts)
@@ -195,6 +288,27 @@ class TestSlurmScheduler:
 
 
 class TestPBSScheduler:
+    @patch("molq.transport.subprocess.run")
+    def test_poll_many_tolerates_finished_ids(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout="12345.pbs01  job  user  00:00:01 R batch\n",
+            stderr="qstat: Unknown Job Id 12346.pbs01\n",
+            returncode=153,
+        )
+        assert PBSScheduler().poll_many(["12345", "12346"]) == {
+            "12345": JobState.RUNNING
+        }
+
+    @patch("molq.transport.subprocess.run")
+    def test_poll_many_server_down_raises(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout="",
+            stderr="Connection refused\nqstat: cannot connect to server pbs01\n",
+            returncode=2,
+        )
+        with pytest.raises(SchedulerError, match="qstat failed"):
+            PBSScheduler().poll_many(["12345"])
+
     @patch("molq.transport.subprocess.run")
     def test_submit_success(self, mock_run, tmp_path: Path):
         mock_run.return_value = MagicMock(
@@ -263,6 +377,27 @@ class TestPBSScheduler:
 
 
 class TestLSFScheduler:
+    @patch("molq.transport.subprocess.run")
+    def test_poll_many_tolerates_unknown_ids(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout="12345 user RUN normal host1 host2 job Jan 1 00:00\n",
+            stderr="Job <12346> is not found\n",
+            returncode=255,
+        )
+        assert LSFScheduler().poll_many(["12345", "12346"]) == {
+            "12345": JobState.RUNNING
+        }
+
+    @patch("molq.transport.subprocess.run")
+    def test_poll_many_lim_down_raises(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout="",
+            stderr="LSF is down. Please wait...\n",
+            returncode=255,
+        )
+        with pytest.raises(SchedulerError, match="bjobs failed"):
+            LSFScheduler().poll_many(["12345"])
+
     @patch("molq.transport.subprocess.run")
     def test_submit_success(self, mock_run, tmp_path: Path):
         mock_run.return_value = MagicMock(
@@ -508,6 +643,17 @@ class TestShellScheduler:
         assert result.state == JobState.LOST
         assert "exit code file" in result.failure_reason
 
+    def test_resolve_terminal_is_a_single_read(self, tmp_path: Path):
+        transport = MagicMock()
+        transport.read_text.return_value = "3\n"
+        s = ShellScheduler(transport=transport)
+
+        result = s.resolve_terminal_with_dir("123", tmp_path)
+
+        assert result.exit_code == 3
+        transport.exists.assert_not_called()
+        transport.read_text.assert_called_once()
+
     def test_poll_many_running(self, tmp_path: Path):
         s = ShellScheduler()
         spec = JobSpec(
@@ -527,6 +673,22 @@ class TestShellScheduler:
         s = ShellScheduler()
         assert s.poll_many(["999999999"]) == {}
 
+    def test_local_poll_does_not_spawn_a_shell(self):
+        import os
+
+        s = ShellScheduler()
+        with patch.object(s._transport, "run") as run:
+            result = s.poll_many([str(os.getpid()), "999999999", "not-a-pid"])
+        assert result == {str(os.getpid()): JobState.RUNNING}
+        run.assert_not_called()
+
+    def test_local_poll_treats_foreign_pid_as_gone(self):
+        # Same verdict as `kill -0` on the remote path: a pid we may not
+        # signal has been reused by someone else's process.
+        s = ShellScheduler()
+        with patch("molq.scheduler.shell.os.kill", side_effect=PermissionError):
+            assert s.poll_many(["1234"]) == {}
+
     def test_uses_injected_transport_for_polling(self, tmp_path: Path):
         """Verify transport.run is called; doesn't matter what state we get back."""
         from unittest.mock import MagicMock
@@ -547,6 +709,23 @@ class TestShellScheduler:
         assert result == {"123": JobState.RUNNING}
         fake.run.assert_called_once()
 
+    def test_poll_many_names_each_pid_once(self):
+        from unittest.mock import MagicMock
+
+        from molq.transport import CommandResult
+
+        fake = MagicMock()
+        fake.run.return_value = CommandResult(
+            argv=("bash",), returncode=0, stdout="11=R\n33=R\n", stderr=""
+        )
+        s = ShellScheduler(transport=fake)
+        result = s.poll_many(["11", "22", "33"])
+
+        assert result == {"11": JobState.RUNNING, "33": JobState.RUNNING}
+        fake.run.assert_called_once()
+        script = fake.run.call_args[0][0][-1]
+        assert all(script.count(pid) == 1 for pid in ("11", "22", "33"))
+
 
 # ---------------------------------------------------------------------------
 # list_queue (squeue / qstat / bjobs)
@@ -584,6 +763,18 @@ class TestListQueue:
         assert entries[1].state == JobState.QUEUED
         assert entries[1].start_time is None  # 'N/A' parsed as None
 
+    @patch("molq.transport.subprocess.run")
+    def test_slurm_job_name_may_contain_delimiter(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout="12345|a|b|alice|R|gpu|2024-03-15T14:30:00|N/A\n",
+            stderr="",
+            returncode=0,
+        )
+        (entry,) = SlurmScheduler().list_queue()
+        assert entry.name == "a|b"
+        assert entry.user == "alice"
+        assert entry.partition == "gpu"
+
     @patch("molq.transport.subprocess.run")
     def test_slurm_handles_failure(self, mock_run):
         mock_run.return_value = MagicMock(stdout="", stderr="error", returncode=1)
@@ -648,6 +839,12 @@ class TestGeneratedScriptQuoting:
         # path that the shell would split on the spaces.
         assert f"bash '{job_dir / 'user_script.sh'}'" in script
 
+    def test_trailing_newline_is_quoted(self):
+        from molq.scheduler.script import _shell_quote
+
+        assert _shell_quote("plain/path.sh") == "plain/path.sh"
+        assert _shell_quote("value\n") == "'value\n'"
+
 
 class TestLSFTerminalParsing:
     """`bhist -l` is prose that echoes the job's own command line back."""
@@ -712,6 +909,30 @@ class TestLSFTerminalParsing:
         )
         assert LSFScheduler().resolve_terminal("99") is None
 
+    @patch("molq.transport.subprocess.run")
+    def test_resolve_terminal_many_splits_one_bhist_call(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout=(
+                "Job <97>, User <alice>, Command <true>\n"
+                "Mon Jan  1 10:01:45: Done successfully.\n"
+                "-" * 78 + "\n\n"
+                "Job <98>, User <alice>, Command <false>\n"
+                "Mon Jan  1 10:01:45: Exited with exit code 3.\n"
+                "-" * 78 + "\n\n"
+                "Job <99>, User <alice>, Command <sleep 500>\n"
+                "Mon Jan  1 10:00:05: Dispatched to <node1>;\n"
+            ),
+            stderr="",
+            returncode=255,
+        )
+        result = LSFScheduler().resolve_terminal_many(["97", "98", "99"])
+
+        mock_run.assert_called_once()
+        assert result["97"].state == JobState.SUCCEEDED
+        assert result["98"].state == JobState.FAILED
+        assert result["98"].exit_code == 3
+        assert "99" not in result
+
 
 class TestDependencyFormatting:
     """Each backend owns its own dependency syntax."""
@@ -402,6 +402,37 @@ class TestAllocationMemory:
         assert reopened.get_record("keep-me") is not None
         reopened.close()
 
+    def test_reopen_adds_dependents_index_without_version_bump(self, tmp_path: Path):
+        # A v8 database written before the index existed gains it on open.
+        db = tmp_path / "mig.db"
+        store = JobStore(db)
+        store._conn.execute("DROP INDEX idx_job_dependencies_dependency")
+        store._conn.commit()
+        store.close()
+
+        reopened = JobStore(db)
+        plan = reopened._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT job_id FROM job_dependencies "
+            "WHERE dependency_job_id = ?",
+            ("x",),
+        ).fetchall()
+        assert any("idx_job_dependencies_dependency" in row[3] for row in plan)
+        version = reopened._conn.execute(
+            "SELECT value FROM molq_meta WHERE key = 'schema_version'"
+        ).fetchone()["value"]
+        assert version == "8"
+        reopened.close()
+
+    def test_reopen_skips_index_ddl_when_present(self, tmp_path: Path, monkeypatch):
+        db = tmp_path / "cur.db"
+        JobStore(db).close()
+        # Any attempt to run the DDL again would now raise.
+        monkeypatch.setattr(
+            "molq.store.schema._CREATE_IDX_DEPENDENTS", "not valid sql"
+        )
+
+        JobStore(db).close()
+
     def test_remembered_allocation_is_public_export(self):
         # AC-1: importable from the molq top-level package, not just molq.models.
         import molq
@@ -11,6 +11,7 @@ from molq.errors import (
     ConfigError,
     JobNotFoundError,
     ScriptError,
+    SubmitError,
 )
 from molq.models import RetryBackoff, RetryPolicy, SubmitorDefaults
 from molq.options import LocalSchedulerOptions, SlurmSchedulerOptions
@@ -208,6 +209,11 @@ class TestSubmit:
         h2 = submitor.submit_job(argv=["echo", "2"])
         assert h1.job_id != h2.job_id
 
+    def test_capabilities_resolved_once(self, submitor, mock_scheduler):
+        submitor.submit_job(argv=["echo", "1"])
+        submitor.submit_job(argv=["echo", "2"])
+        mock_scheduler.capabilities.assert_called_once()
+
     def test_submit_rejects_unsupported_backend_fields(self, memory_store):
         s = Submitor(target=Cluster("dev", "local"), store=memory_store)
 
@@ -331,6 +337,112 @@ class TestSubmit:
             assert family[1].previous_attempt_job_id == family[0].job_id
 
 
+class TestSubmitJobs:
+    def test_submissions_overlap(self, memory_store):
+        import threading
+        import time
+
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_submit(spec, job_dir):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return f"sched-{spec.metadata['i']}"
+
+        scheduler = MagicMock()
+        scheduler.submit.side_effect = slow_submit
+        s = Submitor(
+            target=Cluster("dev", "local", _scheduler_impl=scheduler),
+            store=memory_store,
+        )
+        handles = s.submit_jobs(
+            [{"argv": ["echo", str(i)], "metadata": {"i": str(i)}} for i in range(6)],
+            max_workers=3,
+        )
+
+        assert peak > 1
+        assert [h.scheduler_job_id for h in handles] == [
+            f"sched-{i}" for i in range(6)
+        ]
+
+    def test_first_error_raised_after_all_submitted(self, memory_store):
+        scheduler = MagicMock()
+        scheduler.submit.side_effect = ["1", RuntimeError("boom"), "3"]
+        s = Submitor(
+            target=Cluster("dev", "local", _scheduler_impl=scheduler),
+            store=memory_store,
+        )
+
+        with pytest.raises(RuntimeError, match="boom"):
+            s.submit_jobs([{"argv": ["true"]}] * 3)
+        assert scheduler.submit.call_count == 3
+
+    def test_serial_first_error_raised_after_all_submitted(self, memory_store):
+        scheduler = MagicMock()
+        scheduler.submit.side_effect = [RuntimeError("boom"), "2", "3"]
+        s = Submitor(
+            target=Cluster("dev", "local", _scheduler_impl=scheduler),
+            store=memory_store,
+        )
+
+        with pytest.raises(RuntimeError, match="boom"):
+            s.submit_jobs([{"argv": ["true"]}] * 3, max_workers=1)
+        assert scheduler.submit.call_count == 3
+
+    def test_empty(self, submitor):
+        assert submitor.submit_jobs([]) == []
+
+    def test_max_in_flight_waits_for_active_jobs(self, memory_store, mock_scheduler):
+        active_at_submit: list[int] = []
+        submit = mock_scheduler.submit.side_effect
+
+        def counting_submit(spec, job_dir):
+            active_at_submit.append(len(memory_store.get_active_records("dev")))
+            return submit(spec, job_dir)
+
+        mock_scheduler.submit.side_effect = counting_submit
+        s = Submitor(
+            target=Cluster("dev", "local", _scheduler_impl=mock_scheduler),
+            store=memory_store,
+        )
+        handles = s.submit_jobs([{"argv": ["true"]}] * 5, max_in_flight=2)
+
+        assert len(handles) == 5
+        assert max(active_at_submit) <= 2
+        # Jobs leave the (empty) queue on each reconcile, freeing the slots.
+        assert mock_scheduler.poll_many.call_count >= 2
+
+    def test_close_while_waiting_reports_submitted_handles(
+        self, memory_store, mock_scheduler, mocker
+    ):
+        s = Submitor(
+            target=Cluster("dev", "local", _scheduler_impl=mock_scheduler),
+            store=memory_store,
+        )
+        mocker.patch.object(
+            s._monitor_instance, "wait_for_capacity", side_effect=[2, 0]
+        )
+
+        with pytest.raises(SubmitError, match="closed") as excinfo:
+            s.submit_jobs([{"argv": ["true"]}] * 5, max_in_flight=2)
+
+        submitted = excinfo.value.context["submitted"]
+        assert len(submitted) == 2
+        assert all(s.get_job(h.job_id) for h in submitted)
+        assert excinfo.value.context["pending"] == 3
+
+    def test_max_in_flight_must_be_positive(self, submitor):
+        with pytest.raises(ValueError, match="max_in_flight"):
+            submitor.submit_jobs([{"argv": ["true"]}], max_in_flight=0)
+
+
 # ---------------------------------------------------------------------------
 # get / list / cancel
 # ---------------------------------------------------------------------------
@@ -373,12 +485,69 @@ class TestSubmitorOps:
         with pytest.raises(JobNotFoundError):
             submitor.cancel_job("nonexistent")
 
+    def test_cancel_jobs_batches_through_cancel_many(
+        self, submitor, mock_scheduler, mocker
+    ):
+        cancel_many = mocker.patch.object(
+            type(mock_scheduler), "cancel_many", create=True
+        )
+        handles = [submitor.submit_job(argv=["echo", str(i)]) for i in range(3)]
+
+        submitor.cancel_jobs([h.job_id for h in handles])
+
+        cancel_many.assert_called_once_with(
+            mock_scheduler, [h.scheduler_job_id for h in handles]
+        )
+        mock_scheduler.cancel.assert_not_called()
+        assert all(
+            submitor.get_job(h.job_id).state == JobState.CANCELLED for h in handles
+        )
+
+    def test_cancel_jobs_checks_every_id_first(self, submitor, mock_scheduler):
+        handle = submitor.submit_job(argv=["echo"])
+        with pytest.raises(JobNotFoundError):
+            submitor.cancel_jobs([handle.job_id, "nonexistent"])
+        mock_scheduler.cancel.assert_not_called()
+        assert submitor.get_job(handle.job_id).state != JobState.CANCELLED
+
     def test_get_transitions(self, submitor):
         handle = submitor.submit_job(argv=["echo"])
         transitions = submitor.get_transitions(handle.job_id)
         assert transitions[0].new_state == JobState.CREATED
         assert transitions[-1].new_state == JobState.SUBMITTED
 
+    def test_daemon_backs_off_until_a_change(self, submitor, mocker):
+        changes = iter([[], [], [], ["change"], [], KeyboardInterrupt])
+
+        def reconcile():
+            item = next(changes)
+            if item is KeyboardInterrupt:
+                raise item
+            return item
+
+        mocker.patch.object(submitor._reconciler, "reconcile", side_effect=reconcile)
+        sleep = mocker.patch("molq.submitor.time.sleep")
+
+        with pytest.raises(KeyboardInterrupt):
+            submitor.run_daemon(interval=1.0, max_interval=3.0, run_cleanup=False)
+        assert [c.args[0] for c in sleep.call_args_list] == [1.0, 2.0, 3.0, 1.0, 2.0]
+
+    def test_daemon_keeps_a_fixed_interval_by_default(self, submitor, mocker):
+        changes = iter([[], [], [], KeyboardInterrupt])
+
+        def reconcile():
+            item = next(changes)
+            if item is KeyboardInterrupt:
+                raise item
+            return item
+
+        mocker.patch.object(submitor._reconciler, "reconcile", side_effect=reconcile)
+        sleep = mocker.patch("molq.submitor.time.sleep")
+
+        with pytest.raises(KeyboardInterrupt):
+            submitor.run_daemon(interval=5.0, run_cleanup=False)
+        assert [c.args[0] for c in sleep.call_args_list] == [5.0, 5.0, 5.0]
+
 
 # ---------------------------------------------------------------------------
 # JobHandle
@@ -390,6 +559,10 @@ class TestJobHandle:
         handle = submitor.submit_job(argv=["echo"])
         assert handle.status() == JobState.SUBMITTED
 
+    def test_no_instance_dict(self, submitor):
+        handle = submitor.submit_job(argv=["echo"])
+        assert not hasattr(handle, "__dict__")
+
     def test_cancel(self, submitor, mock_scheduler):
         handle = submitor.submit_job(argv=["echo"])
         handle.cancel()
@@ -98,6 +98,19 @@ def test_local_run_passes_input() -> None:
     assert result.stdout.strip() == "HI"
 
 
+def test_local_run_decodes_utf8_and_replaces_invalid_bytes() -> None:
+    t = LocalTransport()
+    result = t.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; sys.stdout.buffer.write('job-\u00e9 '.encode() + b'\\xff')",
+        ],
+        env={"LANG": "C", "LC_ALL": "C"},
+    )
+    assert result.stdout == "job-\u00e9 \ufffd"
+
+
 def test_local_run_timeout_raises_transport_error() -> None:
     t = LocalTransport()
     with pytest.raises(TransportError):
@@ -363,17 +376,24 @@ def test_ssh_exists_other_returncode_raises(monkeypatch: pytest.MonkeyPatch) ->
         t.exists("/x")
 
 
-def test_ssh_read_text_decodes_base64(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_ssh_read_text_captures_binary_stdout(monkeypatch: pytest.MonkeyPatch) -> None:
     payload = "héllo\nworld"
-    encoded = base64.b64encode(payload.encode("utf-8")).decode("ascii")
-    monkeypatch.setattr(
-        "molq.transport.subprocess.run",
-        lambda *a, **kw: type(
-            "P", (), {"returncode": 0, "stdout": encoded, "stderr": ""}
-        )(),
-    )
+    captured: dict = {}
+
+    def fake_run(argv, **kwargs):
+        captured["argv"] = argv
+        captured["text"] = kwargs.get("text")
+        return type(
+            "P",
+            (),
+            {"returncode": 0, "stdout": payload.encode("utf-8"), "stderr": b""},
+        )()
+
+    monkeypatch.setattr("molq.transport.subprocess.run", fake_run)
     t = SshTransport(options=SshTransportOptions(host="h"))
     assert t.read_text("/x") == payload
+    assert captured["text"] is False
+    assert captured["argv"][-1] == "cat -- /x"
 
 
 def test_ssh_read_text_missing_raises_filenotfound(
@@ -386,8 +406,8 @@ def test_ssh_read_text_missing_raises_filenotfound(
             (),
             {
                 "returncode": 1,
-                "stdout": "",
-                "stderr": "base64: /x: No such file or directory\n",
+                "stdout": b"",
+                "stderr": b"cat: /x: No such file or directory\n",
             },
         )(),
     )
@@ -510,6 +530,38 @@ class TestSshConnectionMultiplexing:
         if path is not None:
             assert len(path) + _CONTROL_TOKEN_GROWTH <= 100
 
+    def test_control_dir_checked_once_per_home(self, tmp_path, monkeypatch):
+        from molq import transport
+        from molq.transport import _ssh_control_path
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setattr(transport, "_CONTROL_PATHS", {})
+        calls = []
+        real = transport._control_path_under
+        monkeypatch.setattr(
+            transport,
+            "_control_path_under",
+            lambda home: calls.append(home) or real(home),
+        )
+        first = _ssh_control_path()
+        for _ in range(3):
+            assert _ssh_control_path() == first
+        assert calls == [str(tmp_path)]
+        assert first == str(tmp_path / ".ssh" / "molq-%C")
+
+    def test_failed_control_dir_is_retried(self, tmp_path, monkeypatch):
+        from molq import transport
+        from molq.transport import _ssh_control_path
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setattr(transport, "_CONTROL_PATHS", {})
+        blocker = tmp_path / ".ssh"
+        blocker.write_text("not a directory")
+        assert _ssh_control_path() is None
+
+        blocker.unlink()
+        assert _ssh_control_path() == str(tmp_path / ".ssh" / "molq-%C")
+
 
 # ---------------------------------------------------------------------------
 # stat / getsize run POSIX shell, not remote python3
@@ -592,7 +644,7 @@ class TestSshReadPortability:
 
     def test_round_trips_through_a_real_shell(self, loopback_ssh, tmp_path: Path):
         target = tmp_path / "payload.bin"
-        # Non-UTF8 bytes and a NUL: the reason base64 is used at all.
+        # Non-UTF8 bytes and a NUL must survive the binary pipe untouched.
         target.write_bytes(b"\x00\xff\xfe binary \n")
 
         got = _loopback_transport(loopback_ssh).read_bytes(str(target))
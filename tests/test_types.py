@@ -251,6 +251,10 @@ class TestJobResources:
         with pytest.raises(dataclasses.FrozenInstanceError):
             r.cpu_count = 8  # type: ignore[misc]
 
+    def test_specs_have_no_instance_dict(self):
+        for spec in (JobResources(), JobScheduling(), JobExecution()):
+            assert not hasattr(spec, "__dict__")
+
 
 class TestJobScheduling:
     def test_defaults(self):